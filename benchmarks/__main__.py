@@ -0,0 +1,80 @@
+"""Benchmark suite for the server hot paths.
+
+Run from the repository root:
+
+    python benchmarks                          # run everything, save results
+    python benchmarks --group micro            # only micro benchmarks
+    python benchmarks --baseline base.json     # flag regressions against a baseline
+"""
+
+import os
+import sys
+import asyncio
+from datetime import datetime
+
+import click
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+sys.path.insert(0, os.path.join(ROOT_DIR, "server"))
+
+from fake_llm import FakeLLMServer  # noqa: E402
+from runner import compare, load_results, run_all, save_results  # noqa: E402
+
+
+@click.command()
+@click.option(
+    "--group", type=click.Choice(["micro", "macro"]), help="Only run one group"
+)
+@click.option(
+    "--filter", "name_filter", help="Only run benchmarks whose name contains this"
+)
+@click.option("--repeat", type=int, help="Override the number of measured iterations")
+@click.option("--output", help="Where to write the JSON results")
+@click.option("--baseline", help="Results JSON to compare against")
+@click.option(
+    "--threshold", default=0.2, show_default=True, help="Allowed slowdown ratio"
+)
+@click.option(
+    "--llm-tokens", default=600, show_default=True, help="Tokens per fake LLM response"
+)
+@click.option(
+    "--llm-token-delay",
+    default=0.0,
+    show_default=True,
+    help="Seconds between fake LLM tokens",
+)
+def main(
+    group, name_filter, repeat, output, baseline, threshold, llm_tokens, llm_token_delay
+):
+    """Run the benchmark suite and optionally compare it with a baseline."""
+    fake_llm = FakeLLMServer(tokens=llm_tokens, token_delay=llm_token_delay)
+
+    # Server configuration is read at import time, so point it at the fake first
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+    os.environ["OPENAI_BASE_URL"] = fake_llm.base_url
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    import cases  # noqa: F401
+
+    with fake_llm:
+        results = asyncio.run(run_all(name_filter, group, repeat))
+
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{timestamp}.json")
+    save_results(results, output)
+    click.echo(f"\nResults written to {output}")
+
+    if baseline:
+        regressions = compare(results, load_results(baseline), threshold)
+        if regressions:
+            click.echo("\nRegressions against baseline:")
+            for regression in regressions:
+                click.echo(f"  {regression}")
+            sys.exit(1)
+        click.echo("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+import os
+import time
+import asyncio
+import importlib.util
+from uuid import uuid4
+
+from a2a.server.events import EventQueue
+from a2a.types import (
+    Message,
+    MessageSendParams,
+    Part,
+    Role,
+    SendStreamingMessageRequest,
+    SendStreamingMessageResponse,
+    SendStreamingMessageSuccessResponse,
+    TextPart,
+)
+
+from agents import BlogWriterAgent
+from agents.content_writer_agent import CONTENT_WRITER_PROMPT
+from llm import create_llm_backend
+from utils.helpers import extract_text_from_parts
+from utils.stage_cache import StageCache
+from utils.post_processing import PostProcessor
+from utils.helpers.blog_helpers import (
+    BlogContentAnalyzer,
+    chunk_content,
+    create_blog_summary,
+    extract_blog_title,
+    format_blog_metadata,
+    normalize_markdown,
+    readability_score,
+    sanitize_filename,
+)
+
+from runner import benchmark
+from fake_llm import generate_tokens
+
+SERVER_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "server")
+
+STREAM_TOKENS = generate_tokens(2000)
+LARGE_POST = "".join(generate_tokens(20000))
+MANY_PARTS = [{"type": "text", "text": token} for token in STREAM_TOKENS]
+
+
+def load_executor_module():
+    """Import server/__main__.py without starting the server."""
+    spec = importlib.util.spec_from_file_location(
+        "blog_writer_server", os.path.join(SERVER_DIR, "__main__.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CannedStage:
+    """Specialist stand-in that streams a fixed token list without any I/O."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    async def stream_process(self, _):
+        for token in self.tokens:
+            yield {"content": token, "done": False}
+        yield {"content": "", "done": True}
+
+
+def streaming_request(topic: str) -> SendStreamingMessageRequest:
+    return SendStreamingMessageRequest(
+        id=str(uuid4()),
+        params=MessageSendParams(
+            message=Message(
+                role=Role.user,
+                parts=[Part(TextPart(text=topic))],
+                messageId=str(uuid4()),
+            )
+        ),
+    )
+
+
+def serialize_event(request_id: str, event) -> str:
+    """Serialize an event the way the A2A SSE endpoint does."""
+    response = SendStreamingMessageResponse(
+        SendStreamingMessageSuccessResponse(id=request_id, result=event)
+    )
+    return response.root.model_dump_json(exclude_none=True)
+
+
+# --- Executor message construction and serialization -------------------------
+
+
+@benchmark("executor.message_build_and_serialize", repeat=10)
+def bench_message_build_and_serialize():
+    total_bytes = 0
+    for token in STREAM_TOKENS:
+        message = Message(
+            role=Role.agent,
+            parts=[Part(TextPart(text=token))],
+            messageId=str(uuid4()),
+            final=False,
+        )
+        total_bytes += len(serialize_event("bench", message))
+    return {"events": len(STREAM_TOKENS), "bytes": total_bytes}
+
+
+@benchmark("helpers.extract_text_from_parts")
+def bench_extract_text_from_parts():
+    extract_text_from_parts(MANY_PARTS)
+
+
+# --- blog_helpers on large inputs --------------------------------------------
+
+
+@benchmark("blog_helpers.extract_blog_title")
+def bench_extract_blog_title():
+    extract_blog_title(LARGE_POST)
+
+
+@benchmark("blog_helpers.format_blog_metadata")
+def bench_format_blog_metadata():
+    format_blog_metadata("benchmark", LARGE_POST)
+
+
+@benchmark("blog_helpers.chunk_content")
+def bench_chunk_content():
+    chunk_content(LARGE_POST)
+
+
+@benchmark("blog_helpers.create_blog_summary")
+def bench_create_blog_summary():
+    create_blog_summary(LARGE_POST)
+
+
+@benchmark("blog_helpers.normalize_markdown")
+def bench_normalize_markdown():
+    normalize_markdown(LARGE_POST)
+
+
+@benchmark("blog_helpers.readability_score")
+def bench_readability_score():
+    readability_score(LARGE_POST)
+
+
+@benchmark("blog_helpers.sanitize_filename")
+def bench_sanitize_filename():
+    for _ in range(1000):
+        sanitize_filename('A "Complete" Guide: Python/Async <2025>?')
+
+
+@benchmark("blog_helpers.content_analyzer_stream")
+def bench_content_analyzer_stream():
+    analyzer = BlogContentAnalyzer("benchmark")
+    for token in STREAM_TOKENS * 10:
+        analyzer.feed(token)
+    analyzer.metadata()
+
+
+# --- Chunk accumulation in BlogWriterAgent.stream ----------------------------
+
+
+@benchmark("agent.stream_chunk_accumulation", repeat=10)
+async def bench_agent_stream_accumulation():
+    agent = BLOG_AGENT
+    chunks = 0
+    async for _ in agent.stream("benchmark topic"):
+        chunks += 1
+    return {"chunks": chunks}
+
+
+# Stage caching is disabled throughout so every run measures the cold path
+BLOG_AGENT = BlogWriterAgent(
+    stage_cache=StageCache(max_entries=0), post_processor=PostProcessor("thread")
+)
+BLOG_AGENT.topic_researcher = CannedStage(STREAM_TOKENS[:500])
+BLOG_AGENT.outline_generator = CannedStage(STREAM_TOKENS[:500])
+BLOG_AGENT.content_writer = CannedStage(STREAM_TOKENS * 5)
+
+
+# --- End to end against the local fake LLM -----------------------------------
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = load_executor_module().BlogWriterAgentExecutor()
+        _executor.agent.stage_cache = StageCache(max_entries=0)
+    return _executor
+
+
+async def run_stream(executor, topic: str) -> dict:
+    """Run one streaming request through the executor and serialize its events."""
+    request = streaming_request(topic)
+    event_queue = EventQueue()
+    started = time.perf_counter()
+    producer = asyncio.create_task(
+        executor.on_message_stream(request, event_queue, None)
+    )
+
+    events, total_bytes, first_event = 0, 0, None
+    while not (producer.done() and event_queue.queue.empty()):
+        try:
+            event = await asyncio.wait_for(event_queue.dequeue_event(), timeout=0.05)
+        except asyncio.TimeoutError:
+            continue
+        if first_event is None:
+            first_event = time.perf_counter() - started
+        events += 1
+        total_bytes += len(serialize_event(request.id, event))
+        event_queue.task_done()
+
+    await producer
+    return {
+        "events": events,
+        "bytes": total_bytes,
+        "first_event_seconds": first_event or 0.0,
+    }
+
+
+@benchmark("e2e.stream_single", group="macro", repeat=5, warmup=1)
+async def bench_e2e_stream_single():
+    return await run_stream(get_executor(), "benchmark topic")
+
+
+@benchmark("e2e.stream_concurrent_8", group="macro", repeat=3, warmup=1)
+async def bench_e2e_stream_concurrent():
+    executor = get_executor()
+    results = await asyncio.gather(
+        *(run_stream(executor, f"benchmark topic {index}") for index in range(8))
+    )
+    return {
+        "events": sum(result["events"] for result in results),
+        "first_event_seconds": max(result["first_event_seconds"] for result in results),
+    }
+
+
+# --- LLM backend overhead: LangChain runnable vs direct async client ---------
+
+
+async def stream_backend(backend) -> dict:
+    """Stream one completion and measure per-token CPU on the event loop thread."""
+    started, cpu_started = time.perf_counter(), time.thread_time()
+    tokens, first_token = 0, None
+    async for _ in backend.astream({"outline": "benchmark outline"}):
+        if first_token is None:
+            first_token = time.perf_counter() - started
+        tokens += 1
+    cpu = time.thread_time() - cpu_started
+    return {
+        "tokens": tokens,
+        "first_token_seconds": first_token or 0.0,
+        "cpu_per_token_us": cpu / max(tokens, 1) * 1e6,
+    }
+
+
+def register_backend_benchmarks(name: str) -> None:
+    backends = {}
+
+    def get_backend():
+        if name not in backends:
+            backends[name] = create_llm_backend(CONTENT_WRITER_PROMPT, backend=name)
+        return backends[name]
+
+    @benchmark(f"llm.{name}_stream", group="macro", repeat=10)
+    async def bench_stream():
+        return await stream_backend(get_backend())
+
+    @benchmark(f"llm.{name}_stream_concurrent_32", group="macro", repeat=3, warmup=1)
+    async def bench_stream_concurrent():
+        backend = get_backend()
+        results = await asyncio.gather(*(stream_backend(backend) for _ in range(32)))
+        tokens = sum(result["tokens"] for result in results)
+        return {
+            "tokens": tokens,
+            "first_token_seconds": max(
+                result["first_token_seconds"] for result in results
+            ),
+        }
+
+
+for backend_name in ("langchain", "openai"):
+    register_backend_benchmarks(backend_name)
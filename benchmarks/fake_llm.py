@@ -0,0 +1,147 @@
+import json
+import time
+import socket
+import asyncio
+import threading
+from typing import Dict, Any, AsyncGenerator
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+WORDS = (
+    "blog readers value clear practical advice with concrete examples and honest "
+    "tradeoffs that help them decide what to try next in their own projects"
+).split()
+
+
+def generate_tokens(count: int) -> list[str]:
+    """Generate markdown-shaped tokens: a title, section headings and paragraphs."""
+    tokens = ["# Fake Blog Post\n\n"]
+    for index in range(count - 1):
+        if index % 200 == 0:
+            tokens.append(f"\n\n## Section {index // 200 + 1}\n\n")
+        elif index % 40 == 0:
+            tokens.append("\n\n")
+        else:
+            tokens.append(WORDS[index % len(WORDS)] + " ")
+    return tokens
+
+
+def _chunk_payload(
+    content: str | None, finish_reason: str | None = None
+) -> Dict[str, Any]:
+    delta = {"content": content} if content is not None else {}
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": "fake-llm",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def _usage(
+    prompt: str, completion_tokens: int, cached_tokens: int = 0
+) -> Dict[str, Any]:
+    prompt_tokens = max(len(prompt.split()), 1)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": min(cached_tokens, prompt_tokens)},
+    }
+
+
+def create_app(tokens: int = 600, token_delay: float = 0.0) -> Starlette:
+    """Build an OpenAI-compatible chat completions app with canned output."""
+    output = generate_tokens(tokens)
+    # Like provider prompt caching: a system message seen before counts as cached
+    seen_prefixes = set()
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = "\n".join(
+            str(message.get("content", "")) for message in body["messages"]
+        )
+        cached_tokens = 0
+        first = body["messages"][0]
+        if first.get("role") == "system":
+            if first["content"] in seen_prefixes:
+                cached_tokens = len(first["content"].split())
+            seen_prefixes.add(first["content"])
+
+        if not body.get("stream"):
+            return JSONResponse(
+                {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": "fake-llm",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {
+                                "role": "assistant",
+                                "content": "".join(output),
+                            },
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": _usage(prompt, len(output), cached_tokens),
+                }
+            )
+
+        include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+
+        async def events() -> AsyncGenerator[str, None]:
+            yield f"data: {json.dumps(_chunk_payload(''))}\n\n"
+            for token in output:
+                if token_delay:
+                    await asyncio.sleep(token_delay)
+                yield f"data: {json.dumps(_chunk_payload(token))}\n\n"
+            yield f"data: {json.dumps(_chunk_payload(None, 'stop'))}\n\n"
+            if include_usage:
+                usage_chunk = {
+                    **_chunk_payload(None),
+                    "choices": [],
+                    "usage": _usage(prompt, len(output), cached_tokens),
+                }
+                yield f"data: {json.dumps(usage_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(
+        routes=[Route("/v1/chat/completions", chat_completions, methods=["POST"])]
+    )
+
+
+class FakeLLMServer:
+    """Run the fake LLM on a free local port in a background thread."""
+
+    def __init__(self, tokens: int = 600, token_delay: float = 0.0):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{self.port}/v1"
+        config = uvicorn.Config(
+            create_app(tokens, token_delay),
+            host="127.0.0.1",
+            port=self.port,
+            log_level="warning",
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> "FakeLLMServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.should_exit = True
+        self._thread.join()
@@ -0,0 +1,146 @@
+import gc
+import json
+import time
+import inspect
+import platform
+import statistics
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+BENCHMARKS: List["Benchmark"] = []
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark case."""
+
+    name: str
+    group: str
+    func: Callable[..., Any]
+    repeat: int = 20
+    warmup: int = 2
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings and extra measurements of one benchmark case."""
+
+    name: str
+    group: str
+    samples: List[float]
+    cpu_samples: List[float]
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "group": self.group,
+            "repeat": len(self.samples),
+            "min": min(self.samples),
+            "median": statistics.median(self.samples),
+            "mean": statistics.fmean(self.samples),
+            "stdev": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "cpu_median": statistics.median(self.cpu_samples),
+            "extra": self.extra,
+        }
+
+
+def benchmark(name: str, group: str = "micro", repeat: int = 20, warmup: int = 2):
+    """Register a benchmark case.
+
+    The decorated function runs one iteration and may be sync or async. It can
+    return a dict of extra measurements, which are averaged over the repeats.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        BENCHMARKS.append(Benchmark(name, group, func, repeat, warmup))
+        return func
+
+    return decorator
+
+
+async def _call(func: Callable[..., Any]) -> Any:
+    result = func()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def run_benchmark(case: Benchmark, repeat: int | None = None) -> BenchmarkResult:
+    """Run a benchmark case and collect wall-clock and CPU timings.
+
+    CPU time is measured for the calling thread only, so the fake LLM server
+    running in a background thread does not count against the code under test.
+    """
+    repeat = repeat or case.repeat
+    for _ in range(case.warmup):
+        await _call(case.func)
+
+    samples, cpu_samples, extras = [], [], []
+    for _ in range(repeat):
+        gc.collect()
+        started, cpu_started = time.perf_counter(), time.thread_time()
+        extra = await _call(case.func)
+        samples.append(time.perf_counter() - started)
+        cpu_samples.append(time.thread_time() - cpu_started)
+        if isinstance(extra, dict):
+            extras.append(extra)
+
+    averaged = {
+        key: statistics.fmean(extra[key] for extra in extras)
+        for key in (extras[0] if extras else {})
+    }
+    return BenchmarkResult(case.name, case.group, samples, cpu_samples, averaged)
+
+
+async def run_all(
+    name_filter: str | None = None, group: str | None = None, repeat: int | None = None
+) -> Dict[str, Any]:
+    """Run every registered benchmark matching the filters."""
+    results = {}
+    for case in BENCHMARKS:
+        if group and case.group != group:
+            continue
+        if name_filter and name_filter not in case.name:
+            continue
+        result = await run_benchmark(case, repeat)
+        results[case.name] = result.to_dict()
+        print(
+            f"{case.name:<45} median {result.to_dict()['median'] * 1000:10.3f} ms"
+            f"   cpu {result.to_dict()['cpu_median'] * 1000:10.3f} ms"
+        )
+
+    return {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Return descriptions of benchmarks slower than the baseline by more than threshold."""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base or not base["median"]:
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {base['median'] * 1000:.3f} ms -> "
+                f"{result['median'] * 1000:.3f} ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
@@ -1,14 +1,31 @@
 import os
+import json
+import hashlib
 import time
 import uuid
+import click
 import httpx
 import asyncio
-from typing import Dict, Any
+import contextlib
+from urllib.parse import urljoin
+from httpx_sse import aconnect_sse
+from typing import Dict, Any, AsyncGenerator, Callable, List
 from a2a.client import A2AClient
-from a2a.types import SendMessageResponse, SendMessageSuccessResponse
+from a2a.client.errors import A2AClientHTTPError
+from a2a.types import (
+    GetTaskSuccessResponse,
+    JSONRPCErrorResponse,
+    SendMessageResponse,
+    SendMessageSuccessResponse,
+    SendStreamingMessageResponse,
+    TaskIdParams,
+    TaskResubscriptionRequest,
+    TaskState,
+)
 
 from config import SERVER_URL
-from utils.logger import logger
+from utils.logger import logger, console_handler
+from dashboard import LiveView, TopicProgress, topic_filename
 from prompts import (
     WELCOME_MESSAGE,
     TOPIC_PROMPT,
@@ -22,8 +39,19 @@ from constants import (
     BLOG_FILE_EXTENSION,
     DEFAULT_FILENAME,
     BLOG_OUTPUT_DIR,
+    MAX_RETRIES,
+    RETRY_DELAY,
+    MAX_CONCURRENT_STREAMS,
+    DASHBOARD_REFRESH_INTERVAL,
 )
 
+try:
+    import zstandard  # noqa: F401 - lets httpx decode zstd responses
+except ImportError:
+    zstandard = None
+
+ACCEPT_ENCODING = "zstd, gzip" if zstandard else "gzip"
+
 
 async def get_a2a_client():
     """Get a new A2A client."""
@@ -33,19 +61,23 @@ async def get_a2a_client():
     return client, http_client
 
 
+def build_message_payload(topic: str) -> Dict[str, Any]:
+    """Build the message/send parameters for a topic."""
+    return {
+        "message": {
+            "role": "user",
+            "parts": [{"type": "text", "text": topic}],
+            "messageId": str(uuid.uuid4()),
+        },
+    }
+
+
 async def send_blog_request(topic: str, stream: bool = False) -> str:
     """Send a blog writing request to the server."""
     client, http_client = await get_a2a_client()
 
     try:
-        message_id = str(uuid.uuid4())
-        send_message_payload = {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": topic}],
-                "messageId": message_id,
-            },
-        }
+        send_message_payload = build_message_payload(topic)
 
         if stream:
             result = await stream_blog_request(client, send_message_payload)
@@ -65,24 +97,21 @@ async def non_stream_blog_request(client: A2AClient, payload: Dict[str, Any]) ->
         response: SendMessageResponse = await client.send_message(payload=payload)
 
         if isinstance(response.root, SendMessageSuccessResponse):
-            if (
-                hasattr(response.root.result, "history")
-                and response.root.result.history
-            ):
-                last_message = response.root.result.history[-1]
-                if hasattr(last_message, "parts") and last_message.parts:
-                    content = ""
-                    for part in last_message.parts:
-                        if hasattr(part.root, "text"):
-                            content += part.root.text
-                    return content
-
-            if hasattr(response.root.result, "parts") and response.root.result.parts:
-                content = ""
-                for part in response.root.result.parts:
-                    if hasattr(part.root, "text"):
-                        content += part.root.text
-                return content
+            result = response.root.result
+            if hasattr(result, "history") and result.history:
+                parts = result.history[-1].parts or []
+            else:
+                parts = getattr(result, "parts", None) or []
+
+            # A finished post comes back as a reference to the stored artifact
+            for part in parts:
+                if hasattr(part.root, "data") and "url" in part.root.data:
+                    return await fetch_artifact(client, part.root.data)
+
+            if parts:
+                return "".join(
+                    part.root.text for part in parts if hasattr(part.root, "text")
+                )
             else:
                 logger.warning("Response does not contain expected content")
                 return "No content was returned from the server."
@@ -98,32 +127,163 @@ async def non_stream_blog_request(client: A2AClient, payload: Dict[str, Any]) ->
         return f"Error: {str(e)}"
 
 
-async def stream_blog_request(client: A2AClient, payload: Dict[str, Any]) -> str:
-    """Send a streaming blog writing request."""
-    logger.info("Sending streaming blog request")
-    full_content = ""
+async def resubscribe_blog_stream(
+    client: A2AClient, task_id: str, offset: int
+) -> AsyncGenerator[SendStreamingMessageResponse, None]:
+    """Resume a task's event stream after the event with sequence number offset."""
+    request = TaskResubscriptionRequest(
+        id=uuid.uuid4().hex,
+        params=TaskIdParams(id=task_id, metadata={"offset": offset}),
+    )
+    async with aconnect_sse(
+        client.httpx_client,
+        "POST",
+        client.url,
+        json=request.model_dump(mode="json"),
+        timeout=None,
+    ) as event_source:
+        async for sse in event_source.aiter_sse():
+            yield SendStreamingMessageResponse(**json.loads(sse.data))
+
+
+def verify_blog_content(content: str, reference: Dict[str, Any]) -> bool:
+    """Check an assembled post against the digest and length sent by the server."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return digest == reference.get("digest") and len(content) == reference.get("length")
+
+
+async def fetch_artifact(client: A2AClient, reference: Dict[str, Any]) -> str:
+    """Download a stored post in chunks and verify it against its digest.
+
+    Chunks are requested compressed; httpx decodes them transparently.
+    """
+    url = urljoin(client.url, reference["url"])
+    size, chunk_size = reference["size"], reference["chunkSize"]
+    data = bytearray()
+    for start in range(0, size, chunk_size):
+        response = await client.httpx_client.get(
+            url,
+            params={"start": start, "end": min(start + chunk_size, size)},
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+        )
+        response.raise_for_status()
+        data.extend(response.content)
+
+    content = data.decode("utf-8")
+    if not verify_blog_content(content, reference):
+        raise ValueError(f"Artifact {reference['artifactId']} failed verification")
+    return content
+
+
+async def get_task_reference(client: A2AClient, task_id: str) -> Dict[str, Any] | None:
+    """Look up the stored post's reference among a task's artifacts."""
+    response = await client.get_task({"id": task_id}, request_id=uuid.uuid4().hex)
+    if not isinstance(response.root, GetTaskSuccessResponse):
+        error_message = getattr(response.root.error, "message", "Unknown error")
+        raise RuntimeError(f"Could not get task {task_id}: {error_message}")
+
+    for artifact in response.root.result.artifacts or []:
+        for part in artifact.parts:
+            if hasattr(part.root, "data") and "url" in part.root.data:
+                return part.root.data
+    return None
+
+
+async def stream_blog_post(
+    client: A2AClient,
+    payload: Dict[str, Any],
+    on_text: Callable[[str, Dict[str, Any]], None],
+) -> str:
+    """Stream a blog post, passing each text part and its metadata to on_text.
+
+    The post arrives once, as deltas tagged with the "content" stage; the final
+    message only references it, so the post is assembled locally and verified
+    against the digest, falling back to the stored artifact on a mismatch. A
+    stream that ends without the reference gets it from 'tasks/get'.
+    Dropped connections are resumed through 'tasks/resubscribe', and a task
+    that ends in the failed state or an error response raises instead of
+    returning partial text.
+    """
+    content_parts = []
+    reference = None
+    task_id = None
+    last_seq = 0
+    reconnects = 0
+    failed = False
+
+    stream_response = client.send_message_streaming(payload=payload)
+
+    while True:
+        try:
+            async for chunk in stream_response:
+                if isinstance(chunk.root, JSONRPCErrorResponse):
+                    error_message = getattr(chunk.root.error, "message", None)
+                    raise RuntimeError(
+                        f"Server error: {error_message or 'Unknown error'}"
+                    )
+                result = chunk.root.result
+                if getattr(result, "type", None) == "task":
+                    task_id = result.id
+                elif getattr(result, "taskId", None):
+                    task_id = result.taskId
 
-    try:
-        stream_response = client.send_message_streaming(payload=payload)
+                status = getattr(result, "status", None)
+                if status is not None and status.state == TaskState.failed:
+                    failed = True
 
-        print("\n--- Writing your blog post (streaming) ---\n")
+                metadata = getattr(result, "metadata", None) or {}
+                last_seq = metadata.get("seq", last_seq)
 
-        async for chunk in stream_response:
-            if hasattr(chunk.root.result, "parts") and chunk.root.result.parts:
-                for part in chunk.root.result.parts:
+                for part in getattr(result, "parts", None) or []:
                     if hasattr(part.root, "text"):
-                        content = part.root.text
+                        on_text(part.root.text, metadata)
+                        if metadata.get("stage") == "content":
+                            content_parts.append(part.root.text)
+                    elif hasattr(part.root, "data"):
+                        reference = part.root.data
+            break
+        except (httpx.TransportError, A2AClientHTTPError) as e:
+            if task_id is None or reconnects >= MAX_RETRIES:
+                raise
+            reconnects += 1
+            logger.warning(
+                f"Stream interrupted ({str(e)}), resuming task {task_id} "
+                f"from event {last_seq}"
+            )
+            await asyncio.sleep(RETRY_DELAY)
+            stream_response = resubscribe_blog_stream(client, task_id, last_seq)
+
+    if failed:
+        raise RuntimeError(f"Blog generation failed for task {task_id}")
+
+    if reference is None and task_id is not None:
+        # A resumed stream can end without the final message when the events
+        # it held were no longer retained
+        reference = await get_task_reference(client, task_id)
+    if reference is None:
+        raise RuntimeError(f"Blog generation for task {task_id} produced no post")
+
+    full_content = "".join(content_parts)
+    if not verify_blog_content(full_content, reference):
+        logger.warning("Streamed post failed verification, fetching stored copy")
+        full_content = await fetch_artifact(client, reference)
+
+    return full_content
 
-                        if getattr(chunk.root.result, "final", False):
-                            full_content = content
-                        else:
-                            print(content, end="", flush=True)
 
-        print("\n\n--- Blog post completed ---\n")
+async def stream_blog_request(client: A2AClient, payload: Dict[str, Any]) -> str:
+    """Send a streaming blog writing request, printing the post as it arrives."""
+    logger.info("Sending streaming blog request")
+    try:
+        print("\n--- Writing your blog post (streaming) ---\n")
 
-        if full_content:
-            print(full_content)
+        full_content = await stream_blog_post(
+            client,
+            payload,
+            on_text=lambda text, metadata: print(text, end="", flush=True),
+        )
 
+        print("\n\n--- Blog post completed ---\n")
         return full_content
     except Exception as e:
         logger.error(f"Error in streaming blog request: {str(e)}")
@@ -146,23 +306,23 @@ def save_blog_post(content: str, filename: str = None) -> str:
     # Create the full file path
     file_path = os.path.join(BLOG_OUTPUT_DIR, filename)
 
-    # Check if file exists and make unique if needed
+    # Save the content, numbering the filename if it is taken; exclusive
+    # creation keeps concurrent saves from overwriting each other
     counter = 1
     original_filename = filename[: -len(BLOG_FILE_EXTENSION)]
-    while os.path.exists(file_path):
-        filename = f"{original_filename}_{counter}{BLOG_FILE_EXTENSION}"
-        file_path = os.path.join(BLOG_OUTPUT_DIR, filename)
-        counter += 1
-
-    # Save the content
-    try:
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(content)
-        logger.info(f"Blog post saved to {file_path}")
-        return file_path
-    except Exception as e:
-        logger.error(f"Error saving blog post: {str(e)}")
-        return None
+    while True:
+        try:
+            with open(file_path, "x", encoding="utf-8") as file:
+                file.write(content)
+            logger.info(f"Blog post saved to {file_path}")
+            return file_path
+        except FileExistsError:
+            filename = f"{original_filename}_{counter}{BLOG_FILE_EXTENSION}"
+            file_path = os.path.join(BLOG_OUTPUT_DIR, filename)
+            counter += 1
+        except Exception as e:
+            logger.error(f"Error saving blog post: {str(e)}")
+            return None
 
 
 async def send_blog_request_with_retry(
@@ -187,6 +347,68 @@ async def send_blog_request_with_retry(
             await asyncio.sleep(wait_time)
 
 
+async def stream_topic(
+    client: A2AClient, progress: TopicProgress, slots: asyncio.Semaphore
+) -> None:
+    """Stream one topic's post for the dashboard and save it once finished."""
+    async with slots:
+        progress.start()
+        try:
+            content = await stream_blog_post(
+                client, build_message_payload(progress.topic), progress.on_text
+            )
+            if not content:
+                raise ValueError(progress.message or "No content was returned")
+
+            path = await asyncio.to_thread(
+                save_blog_post, content, topic_filename(progress.topic)
+            )
+            if path is None:
+                raise OSError("Failed to save the blog post")
+            progress.path = path
+            progress.finish("saved")
+        except Exception as e:
+            logger.error(f"Error streaming topic {progress.topic}: {str(e)}")
+            progress.finish("failed", str(e))
+
+
+async def run_dashboard(topics: List[str], concurrency: int) -> List[TopicProgress]:
+    """Stream several topics at once over one connection pool on a live view.
+
+    Logging goes to the log file only while the view is drawn, so log lines
+    do not break up the redrawn table.
+    """
+    try:
+        client, http_client = await get_a2a_client()
+    except Exception as e:
+        logger.error(f"Application error: {str(e)}")
+        print(f"\nAn error occurred: {str(e)}")
+        print("Please check the logs for details or try again later.")
+        return []
+
+    progress = [TopicProgress(topic) for topic in topics]
+    view = LiveView(progress, DASHBOARD_REFRESH_INTERVAL)
+    slots = asyncio.Semaphore(concurrency)
+
+    logger.removeHandler(console_handler)
+    refresher = asyncio.create_task(view.run())
+    try:
+        await asyncio.gather(
+            *(stream_topic(client, topic, slots) for topic in progress)
+        )
+    finally:
+        refresher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await refresher
+        view.draw()
+        logger.addHandler(console_handler)
+        await http_client.aclose()
+
+    saved = sum(topic.status == "saved" for topic in progress)
+    print(f"\n{saved} of {len(progress)} blog posts saved to {BLOG_OUTPUT_DIR}/")
+    return progress
+
+
 async def main():
     """Main client application function."""
     print(WELCOME_MESSAGE)
@@ -279,5 +501,34 @@ async def main():
         print("Please check the logs for details or try again later.")
 
 
+@click.command()
+@click.argument("topics", nargs=-1)
+@click.option(
+    "--topics-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File with one topic per line",
+)
+@click.option(
+    "--concurrency",
+    default=MAX_CONCURRENT_STREAMS,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Topics streamed at the same time",
+)
+def cli(topics, topics_file, concurrency):
+    """Write blog posts interactively, or stream the given topics at once
+    on a live dashboard and save each post as it finishes."""
+    topics = list(topics)
+    if topics_file:
+        with open(topics_file, "r", encoding="utf-8") as file:
+            lines = (line.strip() for line in file)
+            topics.extend(line for line in lines if line and not line.startswith("#"))
+
+    if topics:
+        asyncio.run(run_dashboard(topics, concurrency))
+    else:
+        asyncio.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    cli()
@@ -7,3 +7,7 @@ BLOG_OUTPUT_DIR = "blog_posts"
 MAX_RETRIES = 3
 
 RETRY_DELAY = 2
+
+MAX_CONCURRENT_STREAMS = 4
+
+DASHBOARD_REFRESH_INTERVAL = 0.25
@@ -0,0 +1,132 @@
+import re
+import sys
+import time
+import shutil
+import asyncio
+from typing import Dict, Any, List, TextIO
+
+# Rough characters per token, used to estimate tokens from streamed text
+CHARS_PER_TOKEN = 4
+
+
+def topic_filename(topic: str) -> str:
+    """Build a filename (without extension) from a topic."""
+    return re.sub(r"[^a-z0-9]+", "_", topic.lower()).strip("_")[:50] or "blog_post"
+
+
+class TopicProgress:
+    """Progress of one topic's streaming request, as shown on the dashboard."""
+
+    def __init__(self, topic: str):
+        self.topic = topic
+        self.status = "queued"
+        self.stage = None
+        self.chars = 0
+        self.message = ""
+        self.path = None
+        self.started_at = None
+        self.first_token_at = None
+        self.finished_at = None
+
+    def start(self) -> None:
+        self.status = "streaming"
+        self.started_at = time.monotonic()
+
+    def on_text(self, text: str, metadata: Dict[str, Any]) -> None:
+        """Record a streamed text part.
+
+        Parts tagged with a stage hold its output tokens; "status" parts are
+        the server's progress markers and untagged parts its notices and
+        errors, of which the latest is kept as the topic's message.
+        """
+        stage = metadata.get("stage")
+        if stage in (None, "status"):
+            if text.strip():
+                self.message = " ".join(text.split())
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+        self.stage = stage
+        self.chars += len(text)
+
+    def finish(self, status: str, message: str = "") -> None:
+        self.status = status
+        self.message = message or self.message
+        self.finished_at = time.monotonic()
+
+    @property
+    def tokens(self) -> int:
+        return self.chars // CHARS_PER_TOKEN
+
+    @property
+    def ttft(self) -> float | None:
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        if self.first_token_at is None:
+            return None
+        elapsed = (self.finished_at or time.monotonic()) - self.first_token_at
+        return self.tokens / elapsed if elapsed > 0 else None
+
+    def row(self) -> str:
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "-"
+        rate = self.tokens_per_second
+        rate = f"{rate:.1f}" if rate is not None else "-"
+        detail = self.path if self.status == "saved" else self.message
+        return (
+            f"{self.topic[:32]:<32} {self.stage or '-':<9} {self.tokens:>7} "
+            f"{rate:>7} {ttft:>7}  {self.status:<9} {detail}"
+        ).rstrip()
+
+
+HEADER = f"{'Topic':<32} {'Stage':<9} {'Tokens':>7} {'Tok/s':>7} {'TTFT':>7}  Status"
+
+
+class LiveView:
+    """Terminal view of every topic's progress, redrawn in place.
+
+    When the output is not a terminal, a line is printed whenever a topic
+    changes stage or status instead.
+    """
+
+    def __init__(
+        self,
+        progress: List[TopicProgress],
+        refresh_interval: float = 0.25,
+        output: TextIO = sys.stdout,
+    ):
+        self.progress = progress
+        self.refresh_interval = refresh_interval
+        self.output = output
+        self.live = output.isatty()
+        self._drawn = 0
+        self._shown: Dict[int, tuple] = {}
+
+    async def run(self) -> None:
+        while True:
+            self.draw()
+            await asyncio.sleep(self.refresh_interval)
+
+    def draw(self) -> None:
+        if self.live:
+            # Rows are clipped to the terminal so none wraps onto a second line
+            width = shutil.get_terminal_size().columns - 1
+            rows = [HEADER, *(progress.row() for progress in self.progress)]
+            lines = [row[:width] for row in rows]
+            # Move back to the top of the previous drawing and clear it
+            if self._drawn:
+                self.output.write(f"\x1b[{self._drawn}F\x1b[J")
+            self.output.write("\n".join(lines) + "\n")
+            self._drawn = len(lines)
+        else:
+            if not self._shown:
+                self.output.write(HEADER + "\n")
+            for index, progress in enumerate(self.progress):
+                state = (progress.stage, progress.status)
+                if self._shown.get(index) != state:
+                    self._shown[index] = state
+                    self.output.write(progress.row() + "\n")
+        self.output.flush()
@@ -1,51 +1,162 @@
+import time
 import click
+import asyncio
+import uvicorn
 from uuid import uuid4
+from contextlib import aclosing, asynccontextmanager
+from typing import Dict, Any, Tuple
+from starlette.routing import Route
 from a2a.server import A2AServer
 from a2a.server.request_handlers import DefaultA2ARequestHandler
 from a2a.server.events import EventQueue
 from a2a.server.agent_execution import BaseAgentExecutor
+from a2a.server.tasks import InMemoryTaskStore, TaskStore
 from a2a.types import (
+    A2AError,
     AgentAuthentication,
     AgentCapabilities,
     AgentCard,
     AgentSkill,
+    Artifact,
+    DataPart,
+    InvalidParamsError,
     Message,
     Part,
     Role,
     SendMessageRequest,
     SendStreamingMessageRequest,
     Task,
+    TaskResubscriptionRequest,
+    TaskStatusUpdateEvent,
     TextPart,
     TaskStatus,
     TaskState,
 )
 
-from agents import BlogWriterAgent
-from config import HOST, PORT
+from agents import (
+    BlogWriterAgent,
+    TopicResearchAgent,
+    OutlineGeneratorAgent,
+    ContentWriterAgent,
+)
+from config import (
+    HOST,
+    PORT,
+    MAX_CONCURRENT_REQUESTS,
+    INTERACTIVE_RESERVED_SLOTS,
+    SCHEDULER_CLIENT_WEIGHTS,
+    EVENT_LOG_CAPACITY,
+    EVENT_LOG_SPILL_DIR,
+    EVENT_LOG_TTL_SECONDS,
+    ARTIFACT_CHUNK_SIZE,
+    STREAM_QUEUE_SIZE,
+    STREAM_BACKPRESSURE_POLICY,
+    PREFILL_TOPICS_FILE,
+    PREFILL_INTERVAL_SECONDS,
+    PREFILL_IDLE_SECONDS,
+    TASK_RETENTION_TTL_SECONDS,
+    TASK_RETENTION_MAX_TASKS,
+    LOOP_LAG_INTERVAL_SECONDS,
+    SLOW_CALLBACK_SECONDS,
+    PROFILE_DIR,
+    PROFILE_MAX_FILES,
+)
 from utils.logger import logger
+from utils.metrics import metrics, metrics_endpoint
+from utils.scheduler import FairShareScheduler, INTERACTIVE, BATCH
+from utils.event_log import EventLogRegistry, TaskEventLog
+from utils.artifact_store import ArtifactStore
+from utils.stream_queue import BoundedStreamQueue
+from utils.prefill import PrefillWorker
+from utils.task_retention import RetentionTaskStore
+from utils.loop_monitor import LoopLagMonitor
+from utils.profiling import RequestProfiler
 from utils.helpers import extract_text_from_parts
 
 
+def get_request_metadata(
+    request: SendMessageRequest | SendStreamingMessageRequest,
+) -> Dict[str, Any]:
+    """Merge message and request metadata, with request metadata taking precedence."""
+    return {
+        **(request.params.message.metadata or {}),
+        **(request.params.metadata or {}),
+    }
+
+
+def get_request_identity(
+    request: SendMessageRequest | SendStreamingMessageRequest, default_priority: str
+) -> Tuple[str, str]:
+    """Read the client identity and priority class from request metadata."""
+    metadata = get_request_metadata(request)
+    client_id = str(metadata.get("client_id") or "anonymous")
+    priority = metadata.get("priority", default_priority)
+    return client_id, priority
+
+
+def build_reference_artifact(reference: Dict[str, Any]) -> Artifact:
+    """Build a task artifact that points at a post in the artifact store."""
+    return Artifact(
+        artifactId=reference["artifactId"],
+        name="blog_post",
+        parts=[Part(DataPart(data=reference))],
+    )
+
+
 class BlogWriterAgentExecutor(BaseAgentExecutor):
     """A2A Agent Executor for the Blog Writer Agent."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        task_store: TaskStore | None = None,
+        artifact_store: ArtifactStore | None = None,
+    ):
         self.agent = BlogWriterAgent()
+        self.task_store = task_store or RetentionTaskStore(
+            TASK_RETENTION_MAX_TASKS, TASK_RETENTION_TTL_SECONDS
+        )
+        if isinstance(self.task_store, RetentionTaskStore):
+            self.task_store.on_evict = self.release_task
+        self.artifact_store = artifact_store or ArtifactStore(ARTIFACT_CHUNK_SIZE)
+        self.scheduler = FairShareScheduler(
+            MAX_CONCURRENT_REQUESTS,
+            interactive_reserved=INTERACTIVE_RESERVED_SLOTS,
+            client_weights=SCHEDULER_CLIENT_WEIGHTS,
+        )
+        self.event_logs = EventLogRegistry(
+            EVENT_LOG_CAPACITY, spill_dir=EVENT_LOG_SPILL_DIR, ttl=EVENT_LOG_TTL_SECONDS
+        )
+        self.profiler = RequestProfiler(PROFILE_DIR, PROFILE_MAX_FILES)
+        self._producers = set()
         logger.info("BlogWriterAgentExecutor initialized")
 
+    def release_task(self, task_id: str) -> None:
+        """Drop the artifacts and event log of a task evicted from the task store."""
+        self.artifact_store.delete(task_id)
+        self.event_logs.discard(task_id)
+
     async def on_message_send(
         self, request: SendMessageRequest, event_queue: EventQueue, task: Task | None
     ) -> None:
         """Handler for 'message/send' requests."""
-        try:
-            if task is None:
-                task = Task(
-                    id=str(uuid4()),
-                    contextId=str(uuid4()),
-                    status=TaskStatus(state=TaskState.working),
-                    history=[],
-                )
+        if task is None:
+            task = Task(
+                id=str(uuid4()),
+                contextId=str(uuid4()),
+                status=TaskStatus(state=TaskState.working),
+                history=[],
+            )
 
+        work = self._send(request, event_queue, task)
+        if self.profiler.should_profile(get_request_metadata(request)):
+            work = self.profiler.run(work, f"send-{task.id}")
+        await work
+
+    async def _send(
+        self, request: SendMessageRequest, event_queue: EventQueue, task: Task
+    ) -> None:
+        """Generate a post for a 'message/send' request and enqueue the reply."""
+        try:
             ack_message = Message(
                 role=Role.agent,
                 parts=[
@@ -63,24 +174,43 @@ class BlogWriterAgentExecutor(BaseAgentExecutor):
                 task.history = []
 
             task.history.append(ack_message)
-            event_queue.enqueue_event(ack_message)
 
             topic = extract_text_from_parts(
                 [part.root.model_dump() for part in request.params.message.parts]
             )
 
-            result = await self.agent.invoke(topic)
+            client_id, priority = get_request_identity(request, BATCH)
+            long_form = bool(get_request_metadata(request).get("long_form"))
+            async with self.scheduler.slot(client_id, priority):
+                result = await self.agent.invoke(topic, long_form=long_form)
+
+            if result["success"]:
+                reference = self.artifact_store.put(
+                    task.id, str(uuid4()), result["content"]
+                )
+                task.artifacts = [build_reference_artifact(reference)]
+                parts = [Part(DataPart(data=reference))]
+            else:
+                parts = [Part(TextPart(text=result["content"]))]
 
             final_message = Message(
                 role=Role.agent,
-                parts=[Part(TextPart(text=result["content"]))],
+                parts=parts,
                 messageId=str(uuid4()),
+                taskId=task.id,
+                contextId=task.contextId,
                 final=True,
+                metadata=result.get("metadata"),
             )
 
             task.history.append(final_message)
-            task.status = TaskStatus(state=TaskState.completed)
-            event_queue.enqueue_event(task)
+            task.status = TaskStatus(
+                state=TaskState.completed if result["success"] else TaskState.failed
+            )
+            await self.task_store.save(task)
+
+            # message/send replies with the first queued event, so that must be
+            # the final message rather than the acknowledgement
             event_queue.enqueue_event(final_message)
 
             logger.info("Blog writing completed and response sent")
@@ -100,17 +230,104 @@ class BlogWriterAgentExecutor(BaseAgentExecutor):
         event_queue: EventQueue,
         task: Task | None,
     ) -> None:
-        """Handler for 'message/stream' requests."""
+        """Handler for 'message/stream' requests.
+
+        Generation runs in a background task that records every event in the
+        task's event log, so a dropped connection does not stop it and the
+        client can pick the stream back up through 'tasks/resubscribe'. The
+        task itself is sent to this connection only: a logged snapshot would be
+        saved back over the finished task when replayed.
+        """
+        new_task = task is None
+        if task is None:
+            task = Task(
+                id=str(uuid4()),
+                contextId=str(uuid4()),
+                status=TaskStatus(state=TaskState.working),
+                history=[],
+            )
+
+        event_log = self.event_logs.create(task.id)
+        if new_task:
+            event_queue.enqueue_event(task.model_copy())
+
+        work = self._produce_stream(request, task, event_log)
+        if self.profiler.should_profile(get_request_metadata(request)):
+            work = self.profiler.run(work, f"stream-{task.id}")
+        producer = asyncio.create_task(
+            work,
+            name=f"blog-writer-stream-{task.id}",
+        )
+        self._producers.add(producer)
+        producer.add_done_callback(self._producers.discard)
+
+        await self._forward_events(event_log, event_queue)
+
+    async def on_resubscribe(
+        self,
+        request: TaskResubscriptionRequest,
+        event_queue: EventQueue,
+        task: Task,
+    ) -> None:
+        """Handler for 'tasks/resubscribe' requests.
+
+        Sends the task as currently stored, then replays its events after the
+        ``offset`` sequence number given in the request metadata and continues
+        with live events.
+        """
         try:
-            if task is None:
-                task = Task(
-                    id=str(uuid4()),
-                    contextId=str(uuid4()),
-                    status=TaskStatus(state=TaskState.working),
-                    history=[],
+            offset = int((request.params.metadata or {}).get("offset", 0))
+        except (TypeError, ValueError):
+            # End the stream with an error rather than leaving it open
+            event_queue.enqueue_event(
+                A2AError(
+                    InvalidParamsError(message="Resubscribe offset must be an integer")
                 )
-                event_queue.enqueue_event(task)
+            )
+            return
+
+        event_queue.enqueue_event(task)
+        event_log = self.event_logs.get(task.id)
+        if event_log is not None:
+            logger.info(f"Resubscribing to task {task.id} from offset {offset}")
+            await self._forward_events(event_log, event_queue, offset)
+        else:
+            logger.info(f"No event log retained for task {task.id}")
+
+        # Terminate the stream even when the replay held no final event
+        event_queue.enqueue_event(
+            TaskStatusUpdateEvent(
+                taskId=task.id,
+                contextId=task.contextId,
+                status=task.status,
+                final=True,
+            )
+        )
 
+    async def _forward_events(
+        self, event_log: TaskEventLog, event_queue: EventQueue, offset: int = 0
+    ) -> None:
+        """Copy logged events after offset to a connection's event queue.
+
+        The connection's queue is bounded, so a slow client holds forwarding
+        back (or receives merged deltas) instead of buffering the whole post.
+        """
+        stream_queue = BoundedStreamQueue(
+            event_queue, STREAM_QUEUE_SIZE, STREAM_BACKPRESSURE_POLICY
+        )
+        async with aclosing(event_log.follow(offset)) as events:
+            async for event in events:
+                await stream_queue.put(event)
+        await stream_queue.flush()
+
+    async def _produce_stream(
+        self,
+        request: SendStreamingMessageRequest,
+        task: Task,
+        event_log: TaskEventLog,
+    ) -> None:
+        """Run the streaming pipeline for a request and record its events."""
+        try:
             topic = extract_text_from_parts(
                 [part.root.model_dump() for part in request.params.message.parts]
             )
@@ -121,54 +338,294 @@ class BlogWriterAgentExecutor(BaseAgentExecutor):
                 messageId=str(uuid4()),
                 final=False,
             )
-            event_queue.enqueue_event(start_message)
-
-            full_content = "Starting blog generation...\n"
+            event_log.append(start_message)
+
+            client_id, priority = get_request_identity(request, INTERACTIVE)
+            started = time.monotonic()
+            first_token = True
+            long_form = bool(get_request_metadata(request).get("long_form"))
+
+            async with self.scheduler.slot(client_id, priority):
+                async for chunk in self.agent.stream(topic, long_form=long_form):
+                    # Status markers are sent before any model call, so only
+                    # a stage's own tokens count
+                    if first_token and chunk["stage"] != "status":
+                        metrics.observe(
+                            "time_to_first_chunk_seconds",
+                            time.monotonic() - started,
+                            priority=priority,
+                        )
+                        first_token = False
 
-            async for chunk in self.agent.stream(topic):
-                message = Message(
-                    role=Role.agent,
-                    parts=[Part(TextPart(text=chunk["content"]))],
-                    messageId=str(uuid4()),
-                    final=chunk["done"],
-                )
-                event_queue.enqueue_event(message)
+                    metadata = {**chunk.get("metadata", {}), "stage": chunk["stage"]}
+                    if "headings" in chunk:
+                        metadata["headings"] = chunk["headings"]
 
-                if chunk["done"] and "content" in chunk and len(chunk["content"]) > 100:
-                    full_content = chunk["content"]
+                    if "post" in chunk:
+                        await self._complete_streamed_task(
+                            task, chunk["post"], metadata, event_log
+                        )
+                        continue
 
-                    if task.history is None:
-                        task.history = []
+                    # The only done chunk without a post is a failure marker
+                    if chunk["done"]:
+                        await self._fail_streamed_task(
+                            task, chunk["content"], event_log, metadata
+                        )
+                        continue
 
-                    final_task_message = Message(
+                    message = Message(
                         role=Role.agent,
-                        parts=[Part(TextPart(text=full_content))],
+                        parts=[Part(TextPart(text=chunk["content"]))],
                         messageId=str(uuid4()),
-                        final=True,
+                        final=False,
+                        metadata=metadata,
                     )
+                    await event_log.wait_for_room()
+                    event_log.append(message)
 
-                    task.history.append(final_task_message)
-                    task.status = TaskStatus(state=TaskState.completed)
-
-                    event_queue.enqueue_event(task)
-
+            if task.status.state == TaskState.working:
+                await self._fail_streamed_task(
+                    task, "Error writing blog: no post was produced", event_log
+                )
             logger.info("Blog writing streaming completed")
         except Exception as e:
             logger.error(f"Error in blog writing streaming: {str(e)}")
-            message = Message(
+            if task.status.state == TaskState.working:
+                await self._fail_streamed_task(
+                    task, f"Error writing blog: {str(e)}", event_log
+                )
+        finally:
+            event_log.close()
+
+    async def _fail_streamed_task(
+        self,
+        task: Task,
+        text: str,
+        event_log: TaskEventLog,
+        metadata: Dict[str, Any] | None = None,
+    ) -> None:
+        """Mark a streamed task failed and end its stream with the failure.
+
+        Saving the failed state lets the task store expire the task like any
+        other finished one, and 'tasks/resubscribe' report it.
+        """
+        task.status = TaskStatus(state=TaskState.failed)
+        await self.task_store.save(task)
+
+        event_log.append(
+            Message(
                 role=Role.agent,
-                parts=[Part(TextPart(text=f"Error writing blog: {str(e)}"))],
+                parts=[Part(TextPart(text=text))],
+                messageId=str(uuid4()),
+                taskId=task.id,
+                contextId=task.contextId,
+                final=False,
+                metadata=metadata,
+            )
+        )
+        event_log.append(
+            TaskStatusUpdateEvent(
+                taskId=task.id,
+                contextId=task.contextId,
+                status=task.status,
+                final=True,
+            )
+        )
+
+    async def _complete_streamed_task(
+        self,
+        task: Task,
+        post: str,
+        metadata: Dict[str, Any],
+        event_log: TaskEventLog,
+    ) -> None:
+        """Store the streamed post as a task artifact and emit a final reference.
+
+        The client already holds the post from the streamed deltas, so the
+        closing events only carry its digest, length and where to fetch it.
+        """
+        reference = self.artifact_store.put(
+            task.id, str(uuid4()), post, digest=metadata["digest"]
+        )
+        task.artifacts = [build_reference_artifact(reference)]
+        task.status = TaskStatus(state=TaskState.completed)
+        await self.task_store.save(task)
+
+        event_log.append(
+            TaskStatusUpdateEvent(
+                taskId=task.id,
+                contextId=task.contextId,
+                status=task.status,
+                final=False,
+            )
+        )
+        event_log.append(
+            Message(
+                role=Role.agent,
+                parts=[Part(DataPart(data=reference))],
+                messageId=str(uuid4()),
+                taskId=task.id,
+                contextId=task.contextId,
+                final=True,
+                metadata=metadata,
+            )
+        )
+
+
+class SpecialistAgentExecutor(BaseAgentExecutor):
+    """A2A Agent Executor serving one specialist stage on its own.
+
+    The message text is the stage input. Replies carry the stage output as
+    text and any other result fields (such as ``success``) as metadata;
+    ``long_form`` in the request metadata selects the content writer's
+    long-form mode.
+    """
+
+    def __init__(self, agent):
+        self.agent = agent
+        logger.info(f"SpecialistAgentExecutor initialized for {type(agent).__name__}")
+
+    def _long_form(
+        self, request: SendMessageRequest | SendStreamingMessageRequest
+    ) -> bool:
+        return bool(get_request_metadata(request).get("long_form")) and hasattr(
+            self.agent, "process_long_form"
+        )
+
+    async def on_message_send(
+        self, request: SendMessageRequest, event_queue: EventQueue, task: Task | None
+    ) -> None:
+        """Handler for 'message/send' requests."""
+        text = extract_text_from_parts(
+            [part.root.model_dump() for part in request.params.message.parts]
+        )
+        if self._long_form(request):
+            result = await self.agent.process_long_form(text)
+        else:
+            result = await self.agent.process(text)
+
+        event_queue.enqueue_event(
+            Message(
+                role=Role.agent,
+                parts=[Part(TextPart(text=result["content"]))],
                 messageId=str(uuid4()),
                 final=True,
+                metadata={
+                    key: value for key, value in result.items() if key != "content"
+                },
+            )
+        )
+
+    async def on_message_stream(
+        self,
+        request: SendStreamingMessageRequest,
+        event_queue: EventQueue,
+        task: Task | None,
+    ) -> None:
+        """Handler for 'message/stream' requests."""
+        text = extract_text_from_parts(
+            [part.root.model_dump() for part in request.params.message.parts]
+        )
+        if self._long_form(request):
+            chunks = self.agent.stream_process_long_form(text)
+        else:
+            chunks = self.agent.stream_process(text)
+
+        async for chunk in chunks:
+            event_queue.enqueue_event(
+                Message(
+                    role=Role.agent,
+                    parts=[Part(TextPart(text=chunk["content"]))],
+                    messageId=str(uuid4()),
+                    final=chunk["done"],
+                    metadata=chunk.get("metadata"),
+                )
             )
-            event_queue.enqueue_event(message)
+
+
+SPECIALISTS = {
+    "topic_research": (
+        TopicResearchAgent,
+        AgentSkill(
+            id="topic_research",
+            name="Topic Research",
+            description="Researches key points, audience and angle for a blog topic",
+            tags=["blog", "research"],
+        ),
+    ),
+    "outline_generator": (
+        OutlineGeneratorAgent,
+        AgentSkill(
+            id="outline_generator",
+            name="Outline Generator",
+            description="Turns topic research into a structured blog outline",
+            tags=["blog", "outline"],
+        ),
+    ),
+    "content_writer": (
+        ContentWriterAgent,
+        AgentSkill(
+            id="content_writer",
+            name="Content Writer",
+            description="Writes a complete blog post from an outline",
+            tags=["blog", "writing"],
+        ),
+    ),
+}
+
+
+def build_agent_card(
+    name: str, description: str, skill: AgentSkill, host: str, port: int
+) -> AgentCard:
+    """Build the agent card served by every agent in this package."""
+    return AgentCard(
+        name=name,
+        description=description,
+        url=f"http://{host}:{port}/",
+        version="1.0.0",
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        capabilities=AgentCapabilities(streaming=True),
+        skills=[skill],
+        authentication=AgentAuthentication(schemes=["public"]),
+    )
+
+
+def serve_specialist(stage: str, host: str, port: int) -> None:
+    """Serve a single specialist stage as a stand-alone A2A server."""
+    agent_class, skill = SPECIALISTS[stage]
+    agent_card = build_agent_card(
+        f"{skill.name} Agent", skill.description, skill, host, port
+    )
+    request_handler = DefaultA2ARequestHandler(
+        agent_executor=SpecialistAgentExecutor(agent_class()),
+        task_store=InMemoryTaskStore(),
+    )
+
+    server = A2AServer(agent_card=agent_card, request_handler=request_handler)
+    app = server.app(routes=[Route("/metrics", metrics_endpoint, methods=["GET"])])
+    logger.info(f"{skill.name} A2A Server initialized, starting now...")
+    uvicorn.run(app, host=host, port=port)
 
 
 @click.command()
 @click.option("--host", default=HOST, help="Server host")
 @click.option("--port", default=PORT, type=int, help="Server port")
-def main(host: str, port: int):
+@click.option(
+    "--agent",
+    "agent_name",
+    type=click.Choice(["blog_writer", *SPECIALISTS]),
+    default="blog_writer",
+    help="Agent to serve; specialist stages can run as separate services",
+)
+def main(host: str, port: int, agent_name: str):
     """Start the Blog Writer A2A Server."""
+    if agent_name in SPECIALISTS:
+        logger.info(f"Starting {agent_name} A2A Server on {host}:{port}")
+        serve_specialist(agent_name, host, port)
+        return
+
     logger.info(f"Starting Blog Writer A2A Server on {host}:{port}")
 
     # Define agent skill
@@ -185,23 +642,72 @@ def main(host: str, port: int):
     )
 
     # Create agent card
-    agent_card = AgentCard(
-        name="Blog Writer Agent",
-        description="An advanced blog writing agent that creates high-quality blog posts on any topic",
-        url=f"http://{host}:{port}/",
-        version="1.0.0",
-        defaultInputModes=["text"],
-        defaultOutputModes=["text"],
-        capabilities=AgentCapabilities(streaming=True),
-        skills=[skill],
-        authentication=AgentAuthentication(schemes=["public"]),
+    agent_card = build_agent_card(
+        "Blog Writer Agent",
+        "An advanced blog writing agent that creates high-quality blog posts on any topic",
+        skill,
+        host,
+        port,
     )
 
-    request_handler = DefaultA2ARequestHandler(agent_executor=BlogWriterAgentExecutor())
+    task_store = RetentionTaskStore(
+        TASK_RETENTION_MAX_TASKS, TASK_RETENTION_TTL_SECONDS
+    )
+    artifact_store = ArtifactStore(ARTIFACT_CHUNK_SIZE)
+    agent_executor = BlogWriterAgentExecutor(task_store, artifact_store)
+    request_handler = DefaultA2ARequestHandler(
+        agent_executor=agent_executor, task_store=task_store
+    )
+
+    @asynccontextmanager
+    async def lifespan(app):
+        agent_executor.profiler.install(asyncio.get_running_loop())
+        post_processor = agent_executor.agent.post_processor
+        await post_processor.warm_up()
+
+        loop_monitor = None
+        if LOOP_LAG_INTERVAL_SECONDS > 0:
+            loop_monitor = LoopLagMonitor(
+                LOOP_LAG_INTERVAL_SECONDS, SLOW_CALLBACK_SECONDS
+            )
+            loop_monitor.start()
+
+        prefill_worker = None
+        if PREFILL_TOPICS_FILE:
+            prefill_worker = PrefillWorker(
+                agent_executor.agent,
+                agent_executor.scheduler,
+                PREFILL_TOPICS_FILE,
+                interval=PREFILL_INTERVAL_SECONDS,
+                idle_seconds=PREFILL_IDLE_SECONDS,
+            )
+            prefill_worker.start()
+        yield
+        if prefill_worker:
+            await prefill_worker.stop()
+        if loop_monitor:
+            await loop_monitor.stop()
+        post_processor.shutdown()
 
     server = A2AServer(agent_card=agent_card, request_handler=request_handler)
+    app = server.app(
+        routes=[
+            Route("/metrics", metrics_endpoint, methods=["GET"]),
+            Route(
+                "/tasks/{task_id}/artifacts/{artifact_id}",
+                artifact_store.endpoint,
+                methods=["GET"],
+            ),
+            Route(
+                "/admin/profile",
+                agent_executor.profiler.endpoint,
+                methods=["GET", "POST"],
+            ),
+        ],
+        lifespan=lifespan,
+    )
     logger.info("A2A Server initialized, starting now...")
-    server.start(host=host, port=port)
+    uvicorn.run(app, host=host, port=port)
 
 
 if __name__ == "__main__":
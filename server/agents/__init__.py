@@ -2,10 +2,12 @@ from agents.blog_writer_agent import BlogWriterAgent
 from agents.topic_research_agent import TopicResearchAgent
 from agents.outline_generator_agent import OutlineGeneratorAgent
 from agents.content_writer_agent import ContentWriterAgent
+from agents.remote_agent import RemoteSpecialistAgent
 
 __all__ = [
     "BlogWriterAgent",
     "TopicResearchAgent",
     "OutlineGeneratorAgent",
     "ContentWriterAgent",
+    "RemoteSpecialistAgent",
 ]
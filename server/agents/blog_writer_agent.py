@@ -1,27 +1,93 @@
+import hashlib
 from typing import Dict, Any, AsyncGenerator
 
 from utils.logger import logger
+from utils.helpers.blog_helpers import BlogContentAnalyzer, sanitize_filename
+from utils.post_processing import PostProcessor
 from agents.topic_research_agent import TopicResearchAgent
 from agents.outline_generator_agent import OutlineGeneratorAgent
 from agents.content_writer_agent import ContentWriterAgent
+from agents.remote_agent import RemoteSpecialistAgent
+from utils.stage_cache import StageCache, RESEARCH, OUTLINE
+from config import (
+    SPECIALIST_URLS,
+    STAGE_CACHE_MAX_ENTRIES,
+    STAGE_CACHE_TTL_SECONDS,
+    POST_PROCESSING_POOL,
+    POST_PROCESSING_WORKERS,
+)
+
+
+def create_specialist(stage: str, local_agent_class):
+    """Use the stage's remote A2A endpoints when configured, else run it in process."""
+    if SPECIALIST_URLS.get(stage):
+        return RemoteSpecialistAgent(stage, SPECIALIST_URLS[stage])
+    return local_agent_class()
 
 
 class BlogWriterAgent:
     """Main Blog Writer Agent that coordinates the specialized agents."""
 
-    def __init__(self):
-        self.topic_researcher = TopicResearchAgent()
-        self.outline_generator = OutlineGeneratorAgent()
-        self.content_writer = ContentWriterAgent()
+    def __init__(
+        self,
+        stage_cache: StageCache | None = None,
+        post_processor: PostProcessor | None = None,
+    ):
+        self.stage_cache = stage_cache or StageCache(
+            STAGE_CACHE_MAX_ENTRIES, STAGE_CACHE_TTL_SECONDS
+        )
+        self.post_processor = post_processor or PostProcessor(
+            POST_PROCESSING_POOL, POST_PROCESSING_WORKERS
+        )
+        self.topic_researcher = create_specialist("topic_research", TopicResearchAgent)
+        self.outline_generator = create_specialist(
+            "outline_generator", OutlineGeneratorAgent
+        )
+        self.content_writer = create_specialist("content_writer", ContentWriterAgent)
         logger.info("BlogWriterAgent initialized with all specialized agents")
 
-    async def invoke(self, topic: str) -> Dict[str, Any]:
+    async def research(self, topic: str) -> Dict[str, Any]:
+        """Research a topic, reusing a cached result when available."""
+        cached = self.stage_cache.get(RESEARCH, topic)
+        if cached is not None:
+            return {"content": cached, "success": True}
+
+        result = await self.topic_researcher.process(topic)
+        if result["success"]:
+            self.stage_cache.put(RESEARCH, topic, result["content"])
+        return result
+
+    async def outline(self, research: str) -> Dict[str, Any]:
+        """Outline researched content, reusing a cached result when available."""
+        cached = self.stage_cache.get(OUTLINE, research)
+        if cached is not None:
+            return {"content": cached, "success": True}
+
+        result = await self.outline_generator.process(research)
+        if result["success"]:
+            self.stage_cache.put(OUTLINE, research, result["content"])
+        return result
+
+    def is_prefilled(self, topic: str) -> bool:
+        """Whether both the research and outline of a topic are cached."""
+        research = self.stage_cache.peek(RESEARCH, topic)
+        return research is not None and bool(self.stage_cache.peek(OUTLINE, research))
+
+    async def prefill(self, topic: str) -> bool:
+        """Run and cache the research and outline stages of a topic ahead of time."""
+        research_result = await self.research(topic)
+        if not research_result["success"]:
+            return False
+        outline_result = await self.outline(research_result["content"])
+        return outline_result["success"]
+
+    async def invoke(self, topic: str, long_form: bool = False) -> Dict[str, Any]:
         """Process a blog writing request end-to-end."""
         logger.info(f"Starting blog writing process for topic: {topic}")
 
         # Step 1: Research the topic
         logger.info("Step 1/3: Researching topic...")
-        research_result = await self.topic_researcher.process(topic)
+        research_result = await self.research(topic)
         if not research_result["success"]:
             return {
                 "content": f"Research failed: {research_result['content']}",
@@ -30,9 +96,7 @@ class BlogWriterAgent:
 
         # Step 2: Generate an outline
         logger.info("Step 2/3: Generating outline...")
-        outline_result = await self.outline_generator.process(
-            research_result["content"]
-        )
+        outline_result = await self.outline(research_result["content"])
         if not outline_result["success"]:
             return {
                 "content": f"Outline generation failed: {outline_result['content']}",
@@ -41,64 +105,207 @@ class BlogWriterAgent:
 
         # Step 3: Write the content
         logger.info("Step 3/3: Writing content...")
-        content_result = await self.content_writer.process(outline_result["content"])
+        if long_form:
+            content_result = await self.content_writer.process_long_form(
+                outline_result["content"]
+            )
+        else:
+            content_result = await self.content_writer.process(
+                outline_result["content"]
+            )
+        if content_result["success"]:
+            # Normalize first so that the metadata describes the stored post
+            normalized = await self.post_processor.run(
+                topic, content_result["content"], include=("markdown",)
+            )
+            content_result["content"] = normalized.get(
+                "markdown", content_result["content"]
+            )
+            results = await self.post_processor.run(
+                topic, content_result["content"], exclude=("markdown",)
+            )
+            content_result["metadata"] = {
+                **content_result.get("metadata", {}),
+                **results.pop("metadata", {}),
+                "post_processing": results,
+            }
 
         # Return the final result
         logger.info("Blog writing process completed")
         return content_result
 
-    async def stream(self, topic: str) -> AsyncGenerator[Dict[str, Any], None]:
-        """Stream the blog writing process, showing progress at each stage."""
+    async def stream(
+        self, topic: str, long_form: bool = False
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream the blog writing process, showing progress at each stage.
+
+        Every chunk carries a ``stage``: "status" for progress markers, or the
+        stage ("research", "outline", "content") whose tokens it holds. The post
+        itself is only sent once, as "content" deltas; the final chunk carries
+        its length and SHA-256 digest in ``metadata`` so the receiver can verify
+        the assembled post, and the full text under ``post`` for storage.
+        """
         logger.info(f"Starting streaming blog writing process for topic: {topic}")
 
         # Step 1: Research the topic (streaming)
-        yield {"content": "\n\n🔍 Researching topic...\n\n", "done": False}
-        research_content = ""
+        yield {
+            "content": "\n\n🔍 Researching topic...\n\n",
+            "done": False,
+            "stage": "status",
+        }
+        research_content = self.stage_cache.get(RESEARCH, topic) or ""
 
-        async for chunk in self.topic_researcher.stream_process(topic):
-            if chunk["done"]:
-                research_content = research_content.strip()
-                yield {"content": "\n\n✅ Research completed\n\n", "done": False}
-                break
+        if research_content:
+            yield {"content": research_content, "done": False, "stage": "research"}
+            yield {
+                "content": "\n\n✅ Research completed\n\n",
+                "done": False,
+                "stage": "status",
+            }
+        else:
+            completed = False
+            async for chunk in self.topic_researcher.stream_process(topic):
+                if chunk["done"]:
+                    research_content = research_content.strip()
+                    # Failed streams end with their error text in the done chunk
+                    completed = not chunk["content"]
+                    yield {
+                        "content": "\n\n✅ Research completed\n\n",
+                        "done": False,
+                        "stage": "status",
+                    }
+                    break
 
-            research_content += chunk["content"]
-            yield {"content": chunk["content"], "done": False}
+                research_content += chunk["content"]
+                yield {"content": chunk["content"], "done": False, "stage": "research"}
+
+            if research_content and completed:
+                self.stage_cache.put(RESEARCH, topic, research_content)
 
         if not research_content:
-            yield {"content": "\n\n❌ Research failed\n\n", "done": True}
+            yield {
+                "content": "\n\n❌ Research failed\n\n",
+                "done": True,
+                "stage": "status",
+            }
             return
 
         # Step 2: Generate an outline (streaming)
-        yield {"content": "\n\n📝 Generating outline...\n\n", "done": False}
-        outline_content = ""
+        yield {
+            "content": "\n\n📝 Generating outline...\n\n",
+            "done": False,
+            "stage": "status",
+        }
+        outline_content = self.stage_cache.get(OUTLINE, research_content) or ""
 
-        async for chunk in self.outline_generator.stream_process(research_content):
-            if chunk["done"]:
-                outline_content = outline_content.strip()
-                yield {"content": "\n\n✅ Outline completed\n\n", "done": False}
-                break
+        if outline_content:
+            yield {"content": outline_content, "done": False, "stage": "outline"}
+            yield {
+                "content": "\n\n✅ Outline completed\n\n",
+                "done": False,
+                "stage": "status",
+            }
+        else:
+            completed = False
+            async for chunk in self.outline_generator.stream_process(research_content):
+                if chunk["done"]:
+                    outline_content = outline_content.strip()
+                    completed = not chunk["content"]
+                    yield {
+                        "content": "\n\n✅ Outline completed\n\n",
+                        "done": False,
+                        "stage": "status",
+                    }
+                    break
 
-            outline_content += chunk["content"]
-            yield {"content": chunk['content'], "done": False}
+                outline_content += chunk["content"]
+                yield {"content": chunk["content"], "done": False, "stage": "outline"}
+
+            if outline_content and completed:
+                self.stage_cache.put(OUTLINE, research_content, outline_content)
 
         if not outline_content:
-            yield {"content": "\n\n❌ Outline generation failed\n\n", "done": True}
+            yield {
+                "content": "\n\n❌ Outline generation failed\n\n",
+                "done": True,
+                "stage": "status",
+            }
             return
 
         # Step 3: Write the content (streaming)
-        yield {"content": "\n\n✍️ Writing blog content...\n\n", "done": False}
-        blog_content = ""
+        yield {
+            "content": "\n\n✍️ Writing blog content...\n\n",
+            "done": False,
+            "stage": "status",
+        }
+        blog_parts = []
+        analyzer = BlogContentAnalyzer(topic)
+        digest = hashlib.sha256()
+
+        if long_form:
+            content_stream = self.content_writer.stream_process_long_form(
+                outline_content
+            )
+        else:
+            content_stream = self.content_writer.stream_process(outline_content)
 
-        async for chunk in self.content_writer.stream_process(outline_content):
+        completed = False
+        writer_metadata = {}
+        async for chunk in content_stream:
             if chunk["done"]:
-                yield {"content": "\n\n✅ Blog writing completed\n\n", "done": False}
+                # Failed streams end with their error text in the done chunk
+                completed = not chunk["content"]
+                writer_metadata = chunk.get("metadata", {})
+                if not completed:
+                    logger.error(f"Content writing stream failed: {chunk['content']}")
                 break
 
-            blog_content += chunk["content"]
-            yield {"content": chunk["content"], "done": False}
+            if not chunk["content"]:
+                continue
 
-        # Final result
-        if blog_content:
-            yield {"content": f"\n\n{blog_content}\n", "done": True}
+            blog_parts.append(chunk["content"])
+            digest.update(chunk["content"].encode("utf-8"))
+            headings = analyzer.feed(chunk["content"])
+            if headings:
+                yield {
+                    "content": chunk["content"],
+                    "done": False,
+                    "stage": "content",
+                    "headings": headings,
+                }
+            else:
+                yield {"content": chunk["content"], "done": False, "stage": "content"}
+
+        # Final result: a reference to the streamed post instead of a second copy
+        if blog_parts and completed:
+            yield {
+                "content": "\n\n✅ Blog writing completed\n\n",
+                "done": False,
+                "stage": "status",
+            }
+            post = "".join(blog_parts)
+            # The post already went out as deltas, so it is not rewritten, and
+            # the analyzer already holds its metadata, summary and title
+            results = await self.post_processor.run(
+                topic, post, exclude=("markdown", "metadata", "summary", "filename")
+            )
+            results["filename"] = sanitize_filename(analyzer.title or topic)
+            yield {
+                "content": "",
+                "done": True,
+                "stage": "status",
+                "post": post,
+                "metadata": {
+                    **writer_metadata,
+                    **analyzer.metadata(),
+                    "length": analyzer.length,
+                    "digest": digest.hexdigest(),
+                    "post_processing": results,
+                },
+            }
         else:
-            yield {"content": "\n\n❌ Content writing failed\n\n", "done": True}
+            yield {
+                "content": "\n\n❌ Content writing failed\n\n",
+                "done": True,
+                "stage": "status",
+            }
@@ -1,11 +1,20 @@
-from langchain_openai import ChatOpenAI
-from typing import Dict, Any, AsyncGenerator
-from langchain.prompts import ChatPromptTemplate
+import asyncio
+from typing import Dict, Any, AsyncGenerator, List
 
 from utils.logger import logger
-from config import OPENAI_API_KEY, MODEL_NAME, TEMPERATURE
+from llm import PromptTemplate, create_llm_backend, register_prompt
+from config import LONG_FORM_CHUNK_SIZE, LONG_FORM_MAX_CONCURRENCY
+from utils.helpers.blog_helpers import (
+    BlogSectionMerger,
+    create_outline_context,
+    split_outline_sections,
+)
 
-CONTENT_WRITER_PROMPT = """
+CONTENT_WRITER_PROMPT = register_prompt(
+    PromptTemplate(
+        name="content_writer",
+        version=1,
+        system="""
 You are a specialized blog content writer. Your task is to:
 
 1. Write a comprehensive blog post based on the outline provided
@@ -14,20 +23,48 @@ You are a specialized blog content writer. Your task is to:
 4. Include a strong introduction that hooks the reader and a conclusion that summarizes key points
 5. Make the content valuable, informative, and actionable
 
-Outline: {outline}
-
 Write a complete blog post following the outline exactly.
-"""
+""",
+        user="Outline: {outline}",
+    )
+)
+
+# The overview comes before the part-specific lines, so the sections of one
+# post share a cacheable prefix beyond the system text
+SECTION_WRITER_PROMPT = register_prompt(
+    PromptTemplate(
+        name="section_writer",
+        version=1,
+        system="""
+You are a specialized blog content writer working on one part of a long-form blog post.
+Other writers are writing the remaining parts at the same time, so:
+
+1. Write only the part described in the message, following its outline exactly
+2. Use ## and ### headings for its sections; only part 1 may start with the # title
+3. Only part 1 includes the introduction and only the last part includes the conclusion
+4. Do not repeat or summarize content that belongs to other parts
+5. Maintain a conversational and approachable tone, and make the content valuable and actionable
+
+Write the complete content for your part.
+""",
+        user="""
+Overview of the whole post:
+{context}
+
+You are writing part {index} of {total}.
+
+Outline for this part: {section}
+""",
+    )
+)
 
 
 class ContentWriterAgent:
     """Agent responsible for writing blog content."""
 
     def __init__(self):
-        self.llm = ChatOpenAI(
-            api_key=OPENAI_API_KEY, model=MODEL_NAME, temperature=TEMPERATURE
-        )
-        self.prompt = ChatPromptTemplate.from_template(CONTENT_WRITER_PROMPT)
+        self.backend = create_llm_backend(CONTENT_WRITER_PROMPT)
+        self.section_backend = create_llm_backend(SECTION_WRITER_PROMPT)
         logger.info("ContentWriterAgent initialized")
 
     async def process(self, outline: str) -> Dict[str, Any]:
@@ -35,9 +72,7 @@ class ContentWriterAgent:
         logger.info("Writing content based on outline")
 
         try:
-            chain = self.prompt | self.llm
-            response = await chain.ainvoke({"outline": outline})
-            content_result = response.content
+            content_result = await self.backend.ainvoke({"outline": outline})
 
             logger.info("Content writing completed successfully")
             return {"content": content_result, "success": True}
@@ -51,19 +86,94 @@ class ContentWriterAgent:
         """Stream process an outline and yield blog content results."""
         logger.info("Streaming content writing")
 
-        chain = self.prompt | self.llm
-
         try:
-            async for chunk in chain.astream({"outline": outline}):
-                yield {
-                    "content": chunk.content
-                    if hasattr(chunk, "content")
-                    else str(chunk),
-                    "done": False,
-                }
+            async for content in self.backend.astream({"outline": outline}):
+                yield {"content": content, "done": False}
 
             yield {"content": "", "done": True}
             logger.info("Content writing streaming completed")
         except Exception as e:
             logger.error(f"Error in content writing streaming: {str(e)}")
             yield {"content": f"Error writing content: {str(e)}", "done": True}
+
+    def _start_sections(self, outline: str) -> List[asyncio.Task]:
+        """Split the outline and start writing every section concurrently."""
+        sections = split_outline_sections(outline, LONG_FORM_CHUNK_SIZE)
+        context = create_outline_context(outline, sections)
+        semaphore = asyncio.Semaphore(LONG_FORM_MAX_CONCURRENCY)
+        logger.info(f"Writing long-form content in {len(sections)} sections")
+
+        async def write_section(index: int, section: str) -> str:
+            async with semaphore:
+                return await self.section_backend.ainvoke(
+                    {
+                        "context": context,
+                        "index": index,
+                        "total": len(sections),
+                        "section": section,
+                    }
+                )
+
+        return [
+            asyncio.create_task(write_section(index, section))
+            for index, section in enumerate(sections, start=1)
+        ]
+
+    async def process_long_form(self, outline: str) -> Dict[str, Any]:
+        """Write a long post by generating outline sections concurrently and merging them."""
+        logger.info("Writing long-form content based on outline")
+
+        tasks = self._start_sections(outline)
+        try:
+            sections = await asyncio.gather(*tasks)
+            merger = BlogSectionMerger()
+            content_result = "".join(merger.add(section) for section in sections)
+            if merger.issues:
+                logger.warning(
+                    f"Long-form merge applied {len(merger.issues)} consistency fixes: "
+                    + "; ".join(merger.issues)
+                )
+
+            logger.info("Long-form content writing completed successfully")
+            return {
+                "content": content_result,
+                "success": True,
+                "metadata": {"consistency_issues": merger.issues},
+            }
+        except Exception as e:
+            for task in tasks:
+                task.cancel()
+            logger.error(f"Error in long-form content writing: {str(e)}")
+            return {"content": f"Error writing content: {str(e)}", "success": False}
+
+    async def stream_process_long_form(
+        self, outline: str
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Write sections concurrently and yield them in order as they complete."""
+        logger.info("Streaming long-form content writing")
+
+        tasks = self._start_sections(outline)
+        merger = BlogSectionMerger()
+        try:
+            for task in tasks:
+                content = merger.add(await task)
+                if content:
+                    yield {"content": content, "done": False}
+
+            if merger.issues:
+                logger.warning(
+                    f"Long-form merge applied {len(merger.issues)} consistency fixes: "
+                    + "; ".join(merger.issues)
+                )
+            yield {
+                "content": "",
+                "done": True,
+                "metadata": {"consistency_issues": merger.issues},
+            }
+            logger.info("Long-form content writing streaming completed")
+        except Exception as e:
+            logger.error(f"Error in long-form content writing streaming: {str(e)}")
+            yield {"content": f"Error writing content: {str(e)}", "done": True}
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,11 +1,13 @@
-from langchain_openai import ChatOpenAI
 from typing import Dict, Any, AsyncGenerator
-from langchain.prompts import ChatPromptTemplate
 
 from utils.logger import logger
-from config import OPENAI_API_KEY, MODEL_NAME, TEMPERATURE
+from llm import PromptTemplate, create_llm_backend, register_prompt
 
-OUTLINE_GENERATOR_PROMPT = """
+OUTLINE_GENERATOR_PROMPT = register_prompt(
+    PromptTemplate(
+        name="outline_generator",
+        version=1,
+        system="""
 You are a specialized blog outline generator. Your task is to:
 
 1. Create a compelling and structured outline based on the research provided
@@ -13,20 +15,18 @@ You are a specialized blog outline generator. Your task is to:
 3. Make sure the outline flows logically and covers all key points
 4. Suggest a compelling title for the blog post
 
-Research Summary: {research}
-
 Provide a detailed outline with a clear structure, including title, introduction, sections, and conclusion.
-"""
+""",
+        user="Research Summary: {research}",
+    )
+)
 
 
 class OutlineGeneratorAgent:
     """Agent responsible for generating blog outlines."""
 
     def __init__(self):
-        self.llm = ChatOpenAI(
-            api_key=OPENAI_API_KEY, model=MODEL_NAME, temperature=TEMPERATURE
-        )
-        self.prompt = ChatPromptTemplate.from_template(OUTLINE_GENERATOR_PROMPT)
+        self.backend = create_llm_backend(OUTLINE_GENERATOR_PROMPT)
         logger.info("OutlineGeneratorAgent initialized")
 
     async def process(self, research: str) -> Dict[str, Any]:
@@ -34,9 +34,7 @@ class OutlineGeneratorAgent:
         logger.info("Generating outline based on research")
 
         try:
-            chain = self.prompt | self.llm
-            response = await chain.ainvoke({"research": research})
-            outline_result = response.content
+            outline_result = await self.backend.ainvoke({"research": research})
 
             logger.info("Outline generation completed successfully")
             return {"content": outline_result, "success": True}
@@ -50,16 +48,9 @@ class OutlineGeneratorAgent:
         """Stream process research and yield outline generation results."""
         logger.info("Streaming outline generation")
 
-        chain = self.prompt | self.llm
-
         try:
-            async for chunk in chain.astream({"research": research}):
-                yield {
-                    "content": chunk.content
-                    if hasattr(chunk, "content")
-                    else str(chunk),
-                    "done": False,
-                }
+            async for content in self.backend.astream({"research": research}):
+                yield {"content": content, "done": False}
 
             yield {"content": "", "done": True}
             logger.info("Outline generation streaming completed")
@@ -0,0 +1,236 @@
+import time
+import httpx
+import asyncio
+from uuid import uuid4
+from contextlib import aclosing, asynccontextmanager
+from typing import Dict, Any, AsyncGenerator, AsyncIterator, List, Set
+
+from a2a.client import A2AClient
+from a2a.client.errors import A2AClientError
+from a2a.types import Message, SendMessageSuccessResponse
+
+from utils.logger import logger
+from utils.metrics import metrics
+from config import (
+    SPECIALIST_COOLDOWN_SECONDS,
+    SPECIALIST_MAX_CONNECTIONS,
+    SPECIALIST_TIMEOUT_SECONDS,
+)
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client shared by every specialist endpoint."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=SPECIALIST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=SPECIALIST_MAX_CONNECTIONS,
+                max_keepalive_connections=SPECIALIST_MAX_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+def message_text(message: Message) -> str:
+    return "".join(
+        part.root.text for part in message.parts if hasattr(part.root, "text")
+    )
+
+
+def error_text(stage: str, response: Any) -> str:
+    error = getattr(response.root, "error", None)
+    return f"Error calling {stage}: {getattr(error, 'message', 'unexpected response')}"
+
+
+class EndpointPool:
+    """A2A clients for the replicas of one stage, routed to the least loaded.
+
+    Load is the number of requests this process has in flight to each
+    endpoint; ties go to the endpoint that was picked longest ago. An
+    endpoint that could not be reached is only picked again after a cooldown,
+    unless every other one is cooling down too.
+    """
+
+    def __init__(self, stage: str, urls: List[str]):
+        if not urls:
+            raise ValueError(f"No endpoints configured for stage {stage}")
+        self.stage = stage
+        self.urls = urls
+        self.clients = [A2AClient(get_http_client(), url=url) for url in urls]
+        self.in_flight = [0] * len(urls)
+        self._last_picked = [0] * len(urls)
+        self._cooldown_until = [0.0] * len(urls)
+        self._picks = 0
+
+    def pick(self, exclude: Set[int] = frozenset()) -> int:
+        """Return the index of the least loaded endpoint not in exclude."""
+        now = time.monotonic()
+        candidates = [index for index in range(len(self.urls)) if index not in exclude]
+        index = min(
+            candidates,
+            key=lambda i: (
+                self._cooldown_until[i] > now,
+                self.in_flight[i],
+                self._last_picked[i],
+            ),
+        )
+        self._picks += 1
+        self._last_picked[index] = self._picks
+        return index
+
+    @asynccontextmanager
+    async def acquire(self, exclude: Set[int] = frozenset()) -> AsyncIterator[int]:
+        """Hold an in-flight slot on the least loaded endpoint."""
+        index = self.pick(exclude)
+        self.in_flight[index] += 1
+        self._record(index)
+        try:
+            yield index
+        finally:
+            self.in_flight[index] -= 1
+            self._record(index)
+
+    def mark_failed(self, index: int) -> None:
+        """Pass over an endpoint that could not be reached for a while."""
+        self._cooldown_until[index] = time.monotonic() + SPECIALIST_COOLDOWN_SECONDS
+
+    def _record(self, index: int) -> None:
+        metrics.set_gauge(
+            "specialist_in_flight",
+            self.in_flight[index],
+            stage=self.stage,
+            endpoint=self.urls[index],
+        )
+
+
+class RemoteSpecialistAgent:
+    """Specialist stage served by one or more remote A2A servers.
+
+    Exposes the same ``process``/``stream_process`` interface as the
+    in-process agents, plus the content writer's long-form variants, which
+    are requested through ``long_form`` message metadata. A request that
+    cannot reach an endpoint is retried on the next least loaded one, as long
+    as nothing has been streamed yet. A stream that sends nothing for
+    ``SPECIALIST_TIMEOUT_SECONDS`` is treated as a failed endpoint, since the
+    SDK opens streams without the HTTP client's timeout.
+    """
+
+    def __init__(self, stage: str, urls: List[str]):
+        self.stage = stage
+        self.pool = EndpointPool(stage, urls)
+        logger.info(f"RemoteSpecialistAgent for {stage} initialized with {urls}")
+
+    def _payload(self, text: str, metadata: Dict[str, Any] | None) -> Dict[str, Any]:
+        return {
+            "message": {
+                "role": "user",
+                "parts": [{"type": "text", "text": text}],
+                "messageId": str(uuid4()),
+                "metadata": metadata,
+            },
+        }
+
+    async def _send(
+        self, text: str, metadata: Dict[str, Any] | None = None
+    ) -> Dict[str, Any]:
+        tried: Set[int] = set()
+        while True:
+            async with self.pool.acquire(tried) as index:
+                try:
+                    response = await self.pool.clients[index].send_message(
+                        self._payload(text, metadata), request_id=str(uuid4())
+                    )
+                    break
+                except (A2AClientError, httpx.TransportError) as e:
+                    tried.add(index)
+                    self.pool.mark_failed(index)
+                    if len(tried) == len(self.pool.urls):
+                        logger.error(f"All {self.stage} endpoints failed: {str(e)}")
+                        return {
+                            "content": f"Error calling {self.stage}: {str(e)}",
+                            "success": False,
+                        }
+                    logger.warning(
+                        f"{self.stage} endpoint {self.pool.urls[index]} failed, "
+                        f"retrying elsewhere: {str(e)}"
+                    )
+
+        if not isinstance(response.root, SendMessageSuccessResponse) or not isinstance(
+            response.root.result, Message
+        ):
+            return {"content": error_text(self.stage, response), "success": False}
+
+        result = response.root.result
+        return {**(result.metadata or {}), "content": message_text(result)}
+
+    async def _stream(
+        self, text: str, metadata: Dict[str, Any] | None = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        tried: Set[int] = set()
+        while True:
+            streamed = False
+            async with self.pool.acquire(tried) as index:
+                responses = self.pool.clients[index].send_message_streaming(
+                    self._payload(text, metadata), request_id=str(uuid4())
+                )
+                try:
+                    async with aclosing(responses):
+                        while True:
+                            try:
+                                response = await asyncio.wait_for(
+                                    anext(responses), SPECIALIST_TIMEOUT_SECONDS
+                                )
+                            except StopAsyncIteration:
+                                return
+                            result = getattr(response.root, "result", None)
+                            if not isinstance(result, Message):
+                                content = error_text(self.stage, response)
+                                yield {"content": content, "done": True}
+                                return
+
+                            streamed = True
+                            done = bool(result.final)
+                            chunk = {"content": message_text(result), "done": done}
+                            if result.metadata:
+                                chunk["metadata"] = result.metadata
+                            yield chunk
+                            if done:
+                                return
+                except asyncio.TimeoutError:
+                    error = f"no response in {SPECIALIST_TIMEOUT_SECONDS:g}s"
+                except (A2AClientError, httpx.TransportError) as e:
+                    error = str(e)
+
+            tried.add(index)
+            self.pool.mark_failed(index)
+            if streamed or len(tried) == len(self.pool.urls):
+                logger.error(f"Streaming from {self.stage} failed: {error}")
+                yield {"content": f"Error calling {self.stage}: {error}", "done": True}
+                return
+            logger.warning(
+                f"{self.stage} endpoint {self.pool.urls[index]} failed, "
+                f"retrying elsewhere: {error}"
+            )
+
+    async def process(self, text: str) -> Dict[str, Any]:
+        """Run the stage on a remote endpoint and return its result."""
+        return await self._send(text)
+
+    async def stream_process(self, text: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream the stage from a remote endpoint."""
+        async for chunk in self._stream(text):
+            yield chunk
+
+    async def process_long_form(self, outline: str) -> Dict[str, Any]:
+        """Run the content writer's long-form mode on a remote endpoint."""
+        return await self._send(outline, {"long_form": True})
+
+    async def stream_process_long_form(
+        self, outline: str
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Stream the content writer's long-form mode from a remote endpoint."""
+        async for chunk in self._stream(outline, {"long_form": True}):
+            yield chunk
@@ -1,33 +1,33 @@
-from langchain_openai import ChatOpenAI
 from typing import Dict, Any, AsyncGenerator
-from langchain.prompts import ChatPromptTemplate
 
 from utils.logger import logger
-from config import OPENAI_API_KEY, MODEL_NAME, TEMPERATURE
+from llm import PromptTemplate, create_llm_backend, register_prompt
 
-TOPIC_RESEARCH_PROMPT = """
+TOPIC_RESEARCH_PROMPT = register_prompt(
+    PromptTemplate(
+        name="topic_research",
+        version=1,
+        system="""
 You are a specialized blog topic research agent. Your task is to:
 
 1. Analyze the given blog topic
 2. Research key points that should be included
 3. Identify the target audience
-4. Suggest a clear angle or perspective 
+4. Suggest a clear angle or perspective
 5. Provide 3-5 key points that should be covered in the blog post
 
-Topic: {topic}
-
 Provide your research in a structured format with clear sections.
-"""
+""",
+        user="Topic: {topic}",
+    )
+)
 
 
 class TopicResearchAgent:
     """Agent responsible for blog topic research."""
 
     def __init__(self):
-        self.llm = ChatOpenAI(
-            api_key=OPENAI_API_KEY, model=MODEL_NAME, temperature=TEMPERATURE
-        )
-        self.prompt = ChatPromptTemplate.from_template(TOPIC_RESEARCH_PROMPT)
+        self.backend = create_llm_backend(TOPIC_RESEARCH_PROMPT)
         logger.info("TopicResearchAgent initialized")
 
     async def process(self, topic: str) -> Dict[str, Any]:
@@ -35,9 +35,7 @@ class TopicResearchAgent:
         logger.info(f"Researching topic: {topic}")
 
         try:
-            chain = self.prompt | self.llm
-            response = await chain.ainvoke({"topic": topic})
-            research_result = response.content
+            research_result = await self.backend.ainvoke({"topic": topic})
 
             logger.info("Topic research completed successfully")
             return {"content": research_result, "success": True}
@@ -49,16 +47,9 @@ class TopicResearchAgent:
         """Stream process a topic and yield research results."""
         logger.info(f"Streaming research for topic: {topic}")
 
-        chain = self.prompt | self.llm
-
         try:
-            async for chunk in chain.astream({"topic": topic}):
-                yield {
-                    "content": chunk.content
-                    if hasattr(chunk, "content")
-                    else str(chunk),
-                    "done": False,
-                }
+            async for content in self.backend.astream({"topic": topic}):
+                yield {"content": content, "done": False}
 
             yield {"content": "", "done": True}
             logger.info("Topic research streaming completed")
@@ -6,11 +6,92 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
     raise ValueError("OPENAI_API_KEY environment variable is not set")
+# Optional OpenAI-compatible endpoint, e.g. a local gateway or benchmark fake
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
 
 HOST = os.getenv("HOST", "localhost")
 PORT = int(os.getenv("PORT", "8000"))
 
 MODEL_NAME = os.getenv("MODEL_NAME", "gpt-4o")
 TEMPERATURE = float(os.getenv("TEMPERATURE", "0.7"))
+# "langchain" (ChatPromptTemplate | ChatOpenAI) or "openai" (direct async client)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "langchain")
+
+# Long-form mode: outline units of about this many characters are written concurrently
+LONG_FORM_CHUNK_SIZE = int(os.getenv("LONG_FORM_CHUNK_SIZE", "1500"))
+LONG_FORM_MAX_CONCURRENCY = int(os.getenv("LONG_FORM_MAX_CONCURRENCY", "8"))
+
+# Replayable stream events per task, for tasks/resubscribe
+EVENT_LOG_CAPACITY = int(os.getenv("EVENT_LOG_CAPACITY", "4096"))
+EVENT_LOG_SPILL_DIR = os.getenv("EVENT_LOG_SPILL_DIR") or None
+EVENT_LOG_TTL_SECONDS = float(os.getenv("EVENT_LOG_TTL_SECONDS", "600"))
+
+# Finished posts are served from /tasks/{task_id}/artifacts/{artifact_id} in byte ranges
+ARTIFACT_CHUNK_SIZE = int(os.getenv("ARTIFACT_CHUNK_SIZE", "65536"))
+
+# Undelivered events per streaming connection; "block" or "merge" once full
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "256"))
+STREAM_BACKPRESSURE_POLICY = os.getenv("STREAM_BACKPRESSURE_POLICY", "merge")
+
+# Post-processing of finished posts runs in a "process" or "thread" pool
+POST_PROCESSING_POOL = os.getenv("POST_PROCESSING_POOL", "process")
+POST_PROCESSING_WORKERS = int(os.getenv("POST_PROCESSING_WORKERS", "2"))
+
+# Finished tasks are compacted to a summary and kept for this long, up to a maximum count
+TASK_RETENTION_TTL_SECONDS = float(os.getenv("TASK_RETENTION_TTL_SECONDS", "3600"))
+TASK_RETENTION_MAX_TASKS = int(os.getenv("TASK_RETENTION_MAX_TASKS", "10000"))
+
+# Cached research and outline results, reused across requests for the same topic
+STAGE_CACHE_MAX_ENTRIES = int(os.getenv("STAGE_CACHE_MAX_ENTRIES", "1024"))
+STAGE_CACHE_TTL_SECONDS = float(os.getenv("STAGE_CACHE_TTL_SECONDS", "86400"))
+
+# Idle-time prefill of the stage cache for the topics listed in PREFILL_TOPICS_FILE,
+# one per line; the file is re-read on every pass so it can be edited while running
+PREFILL_TOPICS_FILE = os.getenv("PREFILL_TOPICS_FILE") or None
+PREFILL_INTERVAL_SECONDS = float(os.getenv("PREFILL_INTERVAL_SECONDS", "300"))
+PREFILL_IDLE_SECONDS = float(os.getenv("PREFILL_IDLE_SECONDS", "5"))
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# Event loop lag sampling (0 disables it); the stack of anything blocking the loop
+# for longer than SLOW_CALLBACK_SECONDS is logged
+LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+SLOW_CALLBACK_SECONDS = float(os.getenv("SLOW_CALLBACK_SECONDS", "0.1"))
+
+# CPU profiles of requests with "profile" in their metadata, or of the next requests
+# after a POST to /admin/profile
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+
+# Request scheduling
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "16"))
+INTERACTIVE_RESERVED_SLOTS = int(os.getenv("INTERACTIVE_RESERVED_SLOTS", "4"))
+# Comma separated client weights, e.g. "editorial=4,bulk-import=1"
+SCHEDULER_CLIENT_WEIGHTS = {
+    client.strip(): float(weight)
+    for client, weight in (
+        item.split("=", 1)
+        for item in os.getenv("SCHEDULER_CLIENT_WEIGHTS", "").split(",")
+        if "=" in item
+    )
+}
+for client, weight in SCHEDULER_CLIENT_WEIGHTS.items():
+    if not weight > 0:
+        raise ValueError(
+            f"SCHEDULER_CLIENT_WEIGHTS: weight of {client} must be positive"
+        )
+
+# Specialist stages served by separate A2A servers, as comma separated URLs per stage.
+# A stage without URLs runs in process.
+SPECIALIST_URLS = {
+    stage: [url.strip() for url in os.getenv(variable, "").split(",") if url.strip()]
+    for stage, variable in (
+        ("topic_research", "TOPIC_RESEARCH_URLS"),
+        ("outline_generator", "OUTLINE_GENERATOR_URLS"),
+        ("content_writer", "CONTENT_WRITER_URLS"),
+    )
+}
+SPECIALIST_MAX_CONNECTIONS = int(os.getenv("SPECIALIST_MAX_CONNECTIONS", "100"))
+SPECIALIST_TIMEOUT_SECONDS = float(os.getenv("SPECIALIST_TIMEOUT_SECONDS", "300"))
+# How long an endpoint that could not be reached is passed over by routing
+SPECIALIST_COOLDOWN_SECONDS = float(os.getenv("SPECIALIST_COOLDOWN_SECONDS", "10"))
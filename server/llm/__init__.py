@@ -0,0 +1,17 @@
+from llm.backends import (
+    LangChainBackend,
+    OpenAIBackend,
+    create_llm_backend,
+    get_openai_client,
+)
+from llm.prompts import PromptTemplate, get_prompt, register_prompt
+
+__all__ = [
+    "LangChainBackend",
+    "OpenAIBackend",
+    "create_llm_backend",
+    "get_openai_client",
+    "PromptTemplate",
+    "get_prompt",
+    "register_prompt",
+]
@@ -0,0 +1,129 @@
+from openai import AsyncOpenAI
+from langchain_openai import ChatOpenAI
+from typing import Dict, Any, AsyncGenerator
+from langchain.prompts import ChatPromptTemplate
+
+from llm.prompts import PromptTemplate
+from utils.logger import logger
+from utils.metrics import metrics
+from config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    MODEL_NAME,
+    TEMPERATURE,
+    LLM_BACKEND,
+)
+
+_openai_client: AsyncOpenAI | None = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Return the process-wide async OpenAI client, sharing its connection pool."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
+    return _openai_client
+
+
+def record_prompt_usage(
+    prompt: PromptTemplate, prompt_tokens: int, cached_tokens: int
+) -> None:
+    """Count a call's prompt tokens served from the provider's prompt cache or not."""
+    labels = {"prompt": prompt.name, "version": prompt.version}
+    metrics.increment("prompt_tokens_cached", cached_tokens, **labels)
+    metrics.increment("prompt_tokens_uncached", prompt_tokens - cached_tokens, **labels)
+
+
+class LangChainBackend:
+    """LLM backend built on a ChatPromptTemplate | ChatOpenAI runnable."""
+
+    def __init__(self, template: PromptTemplate):
+        self.template = template
+        self.llm = ChatOpenAI(
+            api_key=OPENAI_API_KEY,
+            base_url=OPENAI_BASE_URL,
+            model=MODEL_NAME,
+            temperature=TEMPERATURE,
+            stream_usage=True,
+        )
+        self.prompt = ChatPromptTemplate.from_messages(
+            [("system", template.system), ("human", template.user)]
+        )
+        self.chain = self.prompt | self.llm
+
+    def _record_usage(self, message) -> None:
+        usage = getattr(message, "usage_metadata", None)
+        if usage:
+            cached = (usage.get("input_token_details") or {}).get("cache_read", 0)
+            record_prompt_usage(self.template, usage["input_tokens"], cached or 0)
+
+    async def ainvoke(self, variables: Dict[str, Any]) -> str:
+        """Run the prompt and return the full completion text."""
+        response = await self.chain.ainvoke(variables)
+        self._record_usage(response)
+        return response.content
+
+    async def astream(self, variables: Dict[str, Any]) -> AsyncGenerator[str, None]:
+        """Run the prompt and yield completion text as it streams."""
+        async for chunk in self.chain.astream(variables):
+            self._record_usage(chunk)
+            yield chunk.content if hasattr(chunk, "content") else str(chunk)
+
+
+class OpenAIBackend:
+    """Lightweight LLM backend that formats prompts with str.format and calls
+    the async OpenAI client directly, skipping LangChain's runnable machinery."""
+
+    def __init__(self, template: PromptTemplate):
+        self.template = template
+        self.client = get_openai_client()
+
+    def _record_usage(self, usage) -> None:
+        if usage:
+            details = usage.prompt_tokens_details
+            cached = (details.cached_tokens if details else 0) or 0
+            record_prompt_usage(self.template, usage.prompt_tokens, cached)
+
+    async def ainvoke(self, variables: Dict[str, Any]) -> str:
+        """Run the prompt and return the full completion text."""
+        response = await self.client.chat.completions.create(
+            model=MODEL_NAME,
+            temperature=TEMPERATURE,
+            messages=self.template.render(variables),
+        )
+        self._record_usage(response.usage)
+        return response.choices[0].message.content or ""
+
+    async def astream(self, variables: Dict[str, Any]) -> AsyncGenerator[str, None]:
+        """Run the prompt and yield completion text as it streams."""
+        stream = await self.client.chat.completions.create(
+            model=MODEL_NAME,
+            temperature=TEMPERATURE,
+            messages=self.template.render(variables),
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        # Closing the stream returns its connection even when the consumer
+        # stops early, e.g. on preemption or cancellation
+        async with stream:
+            async for chunk in stream:
+                self._record_usage(chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+
+BACKENDS = {
+    "langchain": LangChainBackend,
+    "openai": OpenAIBackend,
+}
+
+
+def create_llm_backend(template: PromptTemplate, backend: str | None = None):
+    """Create the LLM backend selected by LLM_BACKEND (or the given name)."""
+    name = backend or LLM_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown LLM backend '{name}', expected one of: {', '.join(BACKENDS)}"
+        )
+    logger.debug(f"Using '{name}' LLM backend")
+    return BACKENDS[name](template)
@@ -0,0 +1,52 @@
+from typing import Any, Dict, List, Tuple
+
+
+class PromptTemplate:
+    """A versioned prompt split into a stable system prefix and a variable suffix.
+
+    The system text holds every instruction and never contains variables, so
+    repeated calls share an identical prefix that providers can cache; only
+    the user suffix is formatted with the call's variables.
+    """
+
+    def __init__(self, name: str, version: int, system: str, user: str):
+        if "{" in system or "}" in system:
+            raise ValueError(f"System text of prompt {name} must not contain variables")
+        self.name = name
+        self.version = version
+        self.system = system.strip()
+        self.user = user.strip()
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}@v{self.version}"
+
+    def render(self, variables: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Chat messages for the given variables, system prefix first."""
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user.format(**variables)},
+        ]
+
+
+# Registered prompts by (name, version)
+PROMPTS: Dict[Tuple[str, int], PromptTemplate] = {}
+
+
+def register_prompt(template: PromptTemplate) -> PromptTemplate:
+    """Register a prompt version; a registered version must not change."""
+    key = (template.name, template.version)
+    if key in PROMPTS:
+        raise ValueError(f"Prompt {template.label} is already registered")
+    PROMPTS[key] = template
+    return template
+
+
+def get_prompt(name: str, version: int | None = None) -> PromptTemplate:
+    """Return a registered prompt, by default its latest version."""
+    if version is None:
+        versions = [key[1] for key in PROMPTS if key[0] == name]
+        if not versions:
+            raise KeyError(f"Unknown prompt '{name}'")
+        version = max(versions)
+    return PROMPTS[(name, version)]
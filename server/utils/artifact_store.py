@@ -0,0 +1,136 @@
+import gzip
+import asyncio
+import hashlib
+from typing import Dict, Any, List
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from utils.logger import logger
+from utils.metrics import metrics
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; gzip is always available
+    zstandard = None
+
+SUPPORTED_ENCODINGS = (["zstd"] if zstandard else []) + ["gzip", "identity"]
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with a negotiated content encoding."""
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    """Pick the preferred supported encoding allowed by an Accept-Encoding header."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        accepted.add(name.strip().lower())
+
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding in accepted:
+            return encoding
+    return "identity"
+
+
+class ArtifactStore:
+    """Holds finished posts so clients can fetch them in ranges.
+
+    Posts are kept once, as UTF-8 bytes, and served through ``endpoint`` in
+    byte ranges of at most ``chunk_size``, compressed per request according to
+    the client's Accept-Encoding.
+    """
+
+    def __init__(self, chunk_size: int = 65536):
+        self.chunk_size = chunk_size
+        self.size = 0
+        self._artifacts: Dict[str, Dict[str, bytes]] = {}
+
+    def put(
+        self, task_id: str, artifact_id: str, content: str, digest: str | None = None
+    ) -> Dict[str, Any]:
+        """Store a post and return the reference clients use to fetch it."""
+        data = content.encode("utf-8")
+        artifacts = self._artifacts.setdefault(task_id, {})
+        self.size += len(data) - len(artifacts.get(artifact_id, b""))
+        artifacts[artifact_id] = data
+        metrics.set_gauge("artifact_store_bytes", self.size)
+        return {
+            "artifactId": artifact_id,
+            "url": f"/tasks/{task_id}/artifacts/{artifact_id}",
+            "length": len(content),
+            "size": len(data),
+            "chunkSize": self.chunk_size,
+            "digest": digest or hashlib.sha256(data).hexdigest(),
+            "encodings": SUPPORTED_ENCODINGS,
+        }
+
+    def get(self, task_id: str, artifact_id: str) -> bytes | None:
+        return self._artifacts.get(task_id, {}).get(artifact_id)
+
+    def artifact_ids(self, task_id: str) -> List[str]:
+        return list(self._artifacts.get(task_id, {}))
+
+    def delete(self, task_id: str) -> None:
+        """Drop every artifact of a task."""
+        artifacts = self._artifacts.pop(task_id, {})
+        self.size -= sum(len(data) for data in artifacts.values())
+        metrics.set_gauge("artifact_store_bytes", self.size)
+
+    async def endpoint(self, request: Request) -> Response:
+        """Serve ``start``-``end`` byte ranges of a stored artifact.
+
+        A response holds at most ``chunk_size`` bytes; a longer or open range
+        is cut short, and the ``X-Artifact-Range`` header says what was sent as
+        ``start-end/size``, with an exclusive end. Offsets are into the
+        uncompressed post rather than the encoded body, so responses are plain
+        200s instead of HTTP partial content.
+        """
+        task_id = request.path_params["task_id"]
+        artifact_id = request.path_params["artifact_id"]
+        data = self.get(task_id, artifact_id)
+        if data is None:
+            return JSONResponse({"error": "Artifact not found"}, status_code=404)
+
+        try:
+            start = int(request.query_params.get("start", 0))
+            end = int(request.query_params.get("end", len(data)))
+        except ValueError:
+            return JSONResponse({"error": "Invalid range"}, status_code=400)
+        if not 0 <= start <= min(end, len(data)):
+            return JSONResponse(
+                {"error": "Range not satisfiable", "size": len(data)}, status_code=416
+            )
+        end = min(end, len(data), start + self.chunk_size)
+
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        body = data[start:end]
+        if encoding != "identity":
+            body = await asyncio.to_thread(compress, body, encoding)
+
+        headers = {
+            "Vary": "Accept-Encoding",
+            "X-Artifact-Range": f"{start}-{end}/{len(data)}",
+        }
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+
+        metrics.increment("artifact_bytes_served", end - start, encoding=encoding)
+        metrics.increment("artifact_bytes_sent", len(body), encoding=encoding)
+        logger.debug(
+            f"Served bytes {start}-{end} of artifact {artifact_id} "
+            f"({len(body)} bytes, {encoding})"
+        )
+        return Response(
+            body,
+            media_type="text/markdown; charset=utf-8",
+            headers=headers,
+        )
@@ -0,0 +1,225 @@
+import os
+import json
+import time
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from typing import Callable, Dict, AsyncGenerator, List, Tuple
+
+from a2a.server.events import Event
+from a2a.types import (
+    Message,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
+)
+
+from utils.logger import logger
+from utils.metrics import metrics
+
+EVENT_TYPES = {
+    event_type.__name__: event_type
+    for event_type in (Message, Task, TaskArtifactUpdateEvent, TaskStatusUpdateEvent)
+}
+
+
+class TaskEventLog:
+    """Bounded, replayable log of the events emitted for one task.
+
+    Every event gets a sequence number, stored in its ``metadata["seq"]``, so a
+    client can resume from the last event it saw. The newest ``capacity`` events
+    are kept in memory; older ones are appended to a JSONL spill file when a
+    spill directory is configured and dropped otherwise. Without a spill file,
+    ``wait_for_room`` lets the producer wait for live followers instead of
+    dropping events they have not read yet. ``on_resize`` is called with the
+    change in the number of events held in memory.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        capacity: int,
+        spill_dir: str | None = None,
+        on_resize: Callable[[int], None] | None = None,
+    ):
+        self.task_id = task_id
+        self.capacity = capacity
+        self.spill_path = (
+            os.path.join(spill_dir, f"{task_id}.jsonl") if spill_dir else None
+        )
+        self.on_resize = on_resize
+        self.last_seq = 0
+        self.closed = False
+        self.finished_at: float | None = None
+
+        self._events: deque[Tuple[int, Event]] = deque()
+        self._spilled = 0
+        self._changed = asyncio.Event()
+        self._cursors: Dict[object, int] = {}
+        self._room = asyncio.Event()
+        self._producer_waiting = False
+
+    def append(self, event: Event) -> int:
+        """Record an event and wake up every follower."""
+        self.last_seq += 1
+        metadata = {**(getattr(event, "metadata", None) or {}), "seq": self.last_seq}
+        event = event.model_copy(update={"metadata": metadata})
+
+        if len(self._events) >= self.capacity:
+            self._evict(*self._events.popleft())
+        elif self.on_resize:
+            self.on_resize(1)
+        self._events.append((self.last_seq, event))
+        self._notify()
+        return self.last_seq
+
+    def _would_evict_unread(self) -> bool:
+        return (
+            not self.spill_path
+            and len(self._events) >= self.capacity
+            and bool(self._cursors)
+            and min(self._cursors.values()) < self._events[0][0]
+        )
+
+    async def wait_for_room(self) -> None:
+        """Wait until the next append would not drop an event a follower needs."""
+        if not self._would_evict_unread():
+            return
+
+        started = time.monotonic()
+        self._producer_waiting = True
+        try:
+            while self._would_evict_unread():
+                self._room.clear()
+                await self._room.wait()
+        finally:
+            self._producer_waiting = False
+        metrics.observe("event_log_producer_stall_seconds", time.monotonic() - started)
+
+    def close(self) -> None:
+        """Mark the task's event stream as finished."""
+        self.closed = True
+        self.finished_at = time.monotonic()
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _evict(self, seq: int, event: Event) -> None:
+        if not self.spill_path:
+            return
+        record = {
+            "seq": seq,
+            "type": type(event).__name__,
+            "event": event.model_dump(mode="json", exclude_none=True),
+        }
+        with open(self.spill_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+        self._spilled = seq
+
+    def _read_spilled(self, offset: int) -> List[Tuple[int, Event]]:
+        events = []
+        with open(self.spill_path, "r", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                if record["seq"] > offset:
+                    event_type = EVENT_TYPES[record["type"]]
+                    events.append(
+                        (record["seq"], event_type.model_validate(record["event"]))
+                    )
+        return events
+
+    def read_after(self, offset: int) -> List[Tuple[int, Event]]:
+        """Return every retained event with a sequence number above offset."""
+        events = []
+        if self._spilled > offset:
+            events.extend(self._read_spilled(offset))
+        elif self._events and self._events[0][0] > offset + 1:
+            logger.warning(
+                f"Events {offset + 1}-{self._events[0][0] - 1} of task {self.task_id} "
+                "are no longer retained"
+            )
+        events.extend((seq, event) for seq, event in self._events if seq > offset)
+        return events
+
+    async def follow(self, offset: int = 0) -> AsyncGenerator[Event, None]:
+        """Replay events after offset, then keep yielding live events until closed."""
+        cursor = offset
+        follower = object()
+        self._cursors[follower] = cursor
+        try:
+            while True:
+                changed = self._changed
+                for seq, event in self.read_after(cursor):
+                    yield event
+                    cursor = self._cursors[follower] = seq
+                    if self._producer_waiting:
+                        self._room.set()
+
+                if self.closed and cursor >= self.last_seq:
+                    return
+                if cursor >= self.last_seq:
+                    await changed.wait()
+        finally:
+            del self._cursors[follower]
+            self._room.set()
+
+    def discard(self) -> None:
+        """Drop retained events, including the spill file."""
+        if self.on_resize:
+            self.on_resize(-len(self._events))
+        self._events.clear()
+        if self.spill_path and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+
+
+class EventLogRegistry:
+    """Per-task event logs, kept for a grace period after the task finishes.
+
+    ``events`` counts the events held in memory across every log.
+    """
+
+    def __init__(self, capacity: int, spill_dir: str | None = None, ttl: float = 600):
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.ttl = ttl
+        self.events = 0
+        self._logs: Dict[str, TaskEventLog] = {}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def create(self, task_id: str) -> TaskEventLog:
+        """Start a fresh log for a task, replacing any previous one."""
+        self.purge_expired()
+        self.discard(task_id)
+        log = TaskEventLog(
+            task_id, self.capacity, self.spill_dir, on_resize=self._resize
+        )
+        self._logs[task_id] = log
+        metrics.set_gauge("event_logs", len(self._logs))
+        return log
+
+    def get(self, task_id: str) -> TaskEventLog | None:
+        return self._logs.get(task_id)
+
+    def discard(self, task_id: str) -> None:
+        log = self._logs.pop(task_id, None)
+        if log:
+            log.discard()
+            metrics.set_gauge("event_logs", len(self._logs))
+
+    def purge_expired(self) -> None:
+        """Drop logs of tasks that finished more than ttl seconds ago."""
+        now = time.monotonic()
+        expired = [
+            task_id
+            for task_id, log in self._logs.items()
+            if log.finished_at is not None and now - log.finished_at > self.ttl
+        ]
+        for task_id in expired:
+            self.discard(task_id)
+
+    def _resize(self, delta: int) -> None:
+        self.events += delta
+        metrics.set_gauge("event_log_events", self.events)
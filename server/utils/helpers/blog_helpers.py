@@ -87,3 +87,304 @@ def create_blog_summary(content: str, max_length: int = 200) -> str:
 
     # Fallback
     return "A blog post about various topics."
+
+
+def normalize_markdown(content: str) -> str:
+    """Normalize whitespace and heading syntax in generated markdown."""
+    lines = [line.rstrip() for line in content.replace("\r\n", "\n").split("\n")]
+    normalized = []
+    in_code_block = False
+    for line in lines:
+        if line.lstrip().startswith("```"):
+            in_code_block = not in_code_block
+        elif not in_code_block:
+            # "##Heading" -> "## Heading", with a blank line before every heading
+            line = re.sub(r"^(#{1,6})(?=[^#\s])", r"\1 ", line)
+            if line.startswith("#") and normalized and normalized[-1]:
+                normalized.append("")
+            # Collapse runs of blank lines into one
+            if not line and (not normalized or not normalized[-1]):
+                continue
+            if normalized and normalized[-1].startswith("#") and line:
+                normalized.append("")
+        normalized.append(line)
+    return "\n".join(normalized).strip() + "\n"
+
+
+def count_syllables(word: str) -> int:
+    """Estimate the syllables in an English word from its vowel groups."""
+    word = word.lower()
+    syllables = len(re.findall(r"[aeiouy]+", word))
+    if word.endswith("e") and not word.endswith("le") and syllables > 1:
+        syllables -= 1
+    return max(syllables, 1)
+
+
+def readability_score(content: str) -> Dict[str, Any]:
+    """Score the readability of a post with the Flesch reading ease formulas."""
+    text = re.sub(r"```.*?```", " ", content, flags=re.DOTALL)
+    text = re.sub(r"^#{1,6}\s+.*$", " ", text, flags=re.MULTILINE)
+    text = re.sub(r"[*_`>\[\]()#-]", " ", text)
+
+    words = re.findall(r"[A-Za-z]+(?:'[A-Za-z]+)?", text)
+    sentences = max(len(re.findall(r"[.!?]+(?:\s|$)", text)), 1)
+    if not words:
+        return {"words": 0, "sentences": 0, "reading_ease": 0.0, "grade_level": 0.0}
+
+    syllables = sum(count_syllables(word) for word in words)
+    words_per_sentence = len(words) / sentences
+    syllables_per_word = syllables / len(words)
+    return {
+        "words": len(words),
+        "sentences": sentences,
+        "reading_ease": round(
+            206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 1
+        ),
+        "grade_level": round(
+            0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 1
+        ),
+    }
+
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+
+
+class BlogContentAnalyzer:
+    """Single-pass analyzer that builds blog metadata while content streams in.
+
+    Produces the same title, word count, summary and chunk boundaries as
+    ``extract_blog_title``, ``format_blog_metadata``, ``create_blog_summary``
+    and ``chunk_content``, without re-scanning the finished post.
+    """
+
+    def __init__(
+        self, topic: str = "", chunk_size: int = 1000, max_summary_length: int = 200
+    ):
+        self.topic = topic
+        self.chunk_size = chunk_size
+        self.max_summary_length = max_summary_length
+
+        self.length = 0
+        self.word_count = 0
+        self.headings: List[Dict[str, Any]] = []
+
+        self._title = None
+        self._first_line = None
+        self._line_buffer = ""
+        self._paragraph_buffer = ""
+        self._paragraph_start = 0
+        self._paragraphs: List[str] = []
+        self._ends_in_word = False
+
+        # Greedy chunk state mirroring chunk_content
+        self._chunk_offsets: List[List[int]] = []
+        self._chunk_start = None
+        self._chunk_end = 0
+        self._chunk_length = 0
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume a stream chunk and return any headings completed by it."""
+        if not text:
+            return []
+
+        words = len(text.split())
+        if words and self._ends_in_word and not text[0].isspace():
+            words -= 1
+        self.word_count += words
+        self._ends_in_word = not text[-1].isspace()
+
+        new_headings = self._feed_lines(text)
+        self._feed_paragraphs(text)
+        self.length += len(text)
+        return new_headings
+
+    def _feed_lines(self, text: str) -> List[Dict[str, Any]]:
+        new_headings = []
+        self._line_buffer += text
+        *lines, self._line_buffer = self._line_buffer.split("\n")
+        for line in lines:
+            heading = self._process_line(line)
+            if heading:
+                new_headings.append(heading)
+        return new_headings
+
+    def _process_line(self, line: str) -> Dict[str, Any] | None:
+        if self._first_line is None and line.strip():
+            self._first_line = line.strip()
+
+        match = HEADING_PATTERN.match(line)
+        if not match:
+            return None
+
+        heading = {"level": len(match.group(1)), "text": match.group(2).strip()}
+        self.headings.append(heading)
+        if self._title is None and heading["level"] <= 2:
+            self._title = match.group(2)
+        return heading
+
+    def _feed_paragraphs(self, text: str) -> None:
+        scan_from = max(len(self._paragraph_buffer) - 1, 0)
+        self._paragraph_buffer += text
+        while True:
+            index = self._paragraph_buffer.find("\n\n", scan_from)
+            if index == -1:
+                break
+            self._close_paragraph(self._paragraph_buffer[:index])
+            self._paragraph_start += index + 2
+            self._paragraph_buffer = self._paragraph_buffer[index + 2 :]
+            scan_from = 0
+
+    def _close_paragraph(self, paragraph: str) -> None:
+        if len(self._paragraphs) < 2:
+            self._paragraphs.append(paragraph)
+
+        end = self._paragraph_start + len(paragraph)
+        if self._chunk_start is not None and (
+            self._chunk_length + len(paragraph) <= self.chunk_size
+        ):
+            self._chunk_length += len(paragraph) + 2
+        else:
+            if self._chunk_start is not None:
+                self._chunk_offsets.append([self._chunk_start, self._chunk_end])
+            self._chunk_start = self._paragraph_start
+            self._chunk_length = len(paragraph) + 2
+        self._chunk_end = end
+
+    def _pending_heading(self) -> Dict[str, Any] | None:
+        match = HEADING_PATTERN.match(self._line_buffer)
+        if not match:
+            return None
+        return {"level": len(match.group(1)), "text": match.group(2).strip()}
+
+    @property
+    def title(self) -> str:
+        """Title as extract_blog_title would report it for the content so far."""
+        if self._title is not None:
+            return self._title
+        match = HEADING_PATTERN.match(self._line_buffer)
+        if match and len(match.group(1)) <= 2:
+            return match.group(2)
+        if self._first_line is not None:
+            return self._first_line
+        if self._line_buffer.strip():
+            return self._line_buffer.strip()
+        return "Blog Post"
+
+    def summary(self) -> str:
+        """Summary as create_blog_summary would report it for the content so far."""
+        paragraphs = self._paragraphs + [self._paragraph_buffer]
+        start_idx = 1 if paragraphs[0].startswith("#") else 0
+        if len(paragraphs) > start_idx:
+            first_para = paragraphs[start_idx].replace("#", "").strip()
+            if len(first_para) > self.max_summary_length:
+                return first_para[: self.max_summary_length] + "..."
+            return first_para
+        return "A blog post about various topics."
+
+    def chunk_offsets(self) -> List[List[int]]:
+        """[start, end) character offsets of the chunks chunk_content would produce."""
+        if self.length <= self.chunk_size:
+            return [[0, self.length]]
+
+        offsets = list(self._chunk_offsets)
+        paragraph = self._paragraph_buffer
+        if self._chunk_start is not None and (
+            self._chunk_length + len(paragraph) <= self.chunk_size
+        ):
+            offsets.append([self._chunk_start, self.length])
+        else:
+            if self._chunk_start is not None:
+                offsets.append([self._chunk_start, self._chunk_end])
+            offsets.append([self._paragraph_start, self.length])
+        return offsets
+
+    def metadata(self) -> Dict[str, Any]:
+        """Return the blog metadata for everything consumed so far."""
+        headings = list(self.headings)
+        pending_heading = self._pending_heading()
+        if pending_heading:
+            headings.append(pending_heading)
+
+        return {
+            "topic": self.topic,
+            "title": self.title,
+            "word_count": self.word_count,
+            "created_at": datetime.now().isoformat(),
+            "summary": self.summary(),
+            "headings": headings,
+            "chunk_offsets": self.chunk_offsets(),
+        }
+
+
+def split_outline_sections(outline: str, chunk_size: int = 1500) -> List[str]:
+    """Split an outline into section-sized units for independent generation."""
+    return [
+        section for section in chunk_content(outline, chunk_size) if section.strip()
+    ]
+
+
+def create_outline_context(outline: str, sections: List[str]) -> str:
+    """Build a compact summary of the whole outline shared by every section."""
+    analyzer = BlogContentAnalyzer()
+    analyzer.feed(outline)
+    lines = [f"Title: {analyzer.title}", "Sections:"]
+    for index, section in enumerate(sections, start=1):
+        first_line = section.strip().split("\n", 1)[0].lstrip("#").strip()
+        lines.append(f"{index}. {first_line}")
+    return "\n".join(lines)
+
+
+class BlogSectionMerger:
+    """Merge independently written sections into one consistent post.
+
+    Keeps a single top-level title and drops title and ``##`` section headings
+    repeated by a later section, recording every fix it makes in ``issues``.
+    Lower-level headings such as a recurring "### Example" are kept.
+    """
+
+    def __init__(self):
+        self.issues: List[str] = []
+        self._seen_headings = set()
+        self._has_title = False
+        self._has_content = False
+        self._sections = 0
+
+    def add(self, section: str) -> str:
+        """Return the section text adjusted for consistency with earlier ones."""
+        self._sections += 1
+        if not section.strip():
+            self.issues.append(f"Section {self._sections} is empty")
+            return ""
+
+        lines = []
+        dropped = False
+        for line in section.strip().split("\n"):
+            match = HEADING_PATTERN.match(line)
+            if not match or len(match.group(1)) > 2:
+                # Skip the blank line that separated a dropped heading
+                if not (dropped and not line.strip()):
+                    lines.append(line)
+                dropped = False
+                continue
+
+            text = match.group(2).strip()
+            key = text.lower()
+            if key in self._seen_headings:
+                self.issues.append(f"Dropped repeated heading '{text}'")
+                dropped = True
+                continue
+            self._seen_headings.add(key)
+            dropped = False
+
+            if len(match.group(1)) == 1:
+                if self._has_title:
+                    self.issues.append(f"Demoted extra title '{text}'")
+                    line = f"## {text}"
+                self._has_title = True
+            lines.append(line)
+
+        text = "\n".join(lines).strip()
+        if self._has_content:
+            return f"\n\n{text}"
+        self._has_content = True
+        return text
@@ -0,0 +1,77 @@
+import sys
+import time
+import asyncio
+import threading
+import traceback
+import contextlib
+
+from utils.logger import logger
+from utils.metrics import metrics
+
+
+class LoopLagMonitor:
+    """Samples event loop lag and reports code that blocks the loop.
+
+    A task on the loop sleeps for ``interval`` and records how late it woke
+    up as ``event_loop_lag_seconds``. A watchdog thread checks that the task
+    keeps waking up; once the loop has been blocked for longer than
+    ``slow_callback_seconds`` it logs the loop thread's stack, which shows the
+    blocking call, and counts it in ``event_loop_slow_callbacks``.
+    """
+
+    def __init__(self, interval: float = 0.5, slow_callback_seconds: float = 0.1):
+        self.interval = interval
+        self.slow_callback_seconds = slow_callback_seconds
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._sample())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(f"Event loop lag monitor started, sampling every {self.interval}s")
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        if self._watchdog:
+            self._watchdog.join()
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            metrics.observe("event_loop_lag_seconds", lag)
+            metrics.set_gauge("event_loop_lag_seconds", lag)
+            self._heartbeat = now
+
+    def _watch(self) -> None:
+        reported = None
+        check_every = min(self.interval, self.slow_callback_seconds) / 2
+        while not self._stopped.wait(check_every):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self.interval
+            if blocked <= self.slow_callback_seconds or heartbeat == reported:
+                continue
+
+            # Report each stall once, with the stack at the time it was caught
+            reported = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            metrics.increment("event_loop_slow_callbacks")
+            logger.warning(
+                f"Event loop blocked for at least {blocked:.3f}s in:\n{stack}"
+            )
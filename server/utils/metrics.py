@@ -0,0 +1,65 @@
+import threading
+from typing import Dict, Any
+from collections import defaultdict
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+
+def _metric_key(name: str, labels: Dict[str, Any]) -> str:
+    if not labels:
+        return name
+    label_str = ",".join(f"{key}={value}" for key, value in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+
+class Metrics:
+    """Process-wide registry of counters, gauges and timing observations."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._observations: Dict[str, Dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Increase a counter."""
+        with self._lock:
+            self._counters[_metric_key(name, labels)] += value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Set a gauge to its current value."""
+        with self._lock:
+            self._gauges[_metric_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record an observation such as a duration or a size."""
+        key = _metric_key(name, labels)
+        with self._lock:
+            stats = self._observations.get(key)
+            if stats is None:
+                stats = {"count": 0, "sum": 0.0, "max": value}
+                self._observations[key] = stats
+            stats["count"] += 1
+            stats["sum"] += value
+            stats["max"] = max(stats["max"], value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of every metric."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "observations": {
+                    key: {**stats, "avg": stats["sum"] / stats["count"]}
+                    for key, stats in self._observations.items()
+                },
+            }
+
+
+metrics = Metrics()
+
+
+async def metrics_endpoint(request: Request) -> JSONResponse:
+    """Serve the current metrics snapshot."""
+    return JSONResponse(metrics.snapshot())
@@ -0,0 +1,148 @@
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable
+
+from utils.logger import logger
+from utils.metrics import metrics
+from utils.helpers.blog_helpers import (
+    BlogContentAnalyzer,
+    create_blog_summary,
+    extract_blog_title,
+    normalize_markdown,
+    readability_score,
+    sanitize_filename,
+)
+
+# Post-processing steps by name. Each takes (topic, content) and must be a
+# module-level function so it can be sent to a process pool.
+POST_PROCESSORS: Dict[str, Callable[[str, str], Any]] = {}
+
+
+def register_post_processor(name: str):
+    """Register a post-processing step under a name."""
+
+    def decorator(func: Callable[[str, str], Any]) -> Callable[[str, str], Any]:
+        POST_PROCESSORS[name] = func
+        return func
+
+    return decorator
+
+
+@register_post_processor("metadata")
+def blog_metadata(topic: str, content: str) -> Dict[str, Any]:
+    """format_blog_metadata fields plus summary, headings and chunk offsets."""
+    analyzer = BlogContentAnalyzer(topic)
+    analyzer.feed(content)
+    return analyzer.metadata()
+
+
+@register_post_processor("summary")
+def blog_summary(topic: str, content: str) -> str:
+    return create_blog_summary(content)
+
+
+@register_post_processor("markdown")
+def blog_markdown(topic: str, content: str) -> str:
+    return normalize_markdown(content)
+
+
+@register_post_processor("readability")
+def blog_readability(topic: str, content: str) -> Dict[str, Any]:
+    return readability_score(content)
+
+
+@register_post_processor("filename")
+def blog_filename(topic: str, content: str) -> str:
+    return sanitize_filename(extract_blog_title(content) or topic)
+
+
+class PostProcessor:
+    """Runs post-processing steps for a finished post concurrently off the event loop.
+
+    Steps run in a process pool by default, or a thread pool with
+    ``pool="thread"``; the pool is created on first use. A failing step is
+    logged and left out of the results instead of failing the post.
+    """
+
+    def __init__(
+        self,
+        pool: str = "process",
+        max_workers: int | None = None,
+        processors: Dict[str, Callable[[str, str], Any]] | None = None,
+    ):
+        if pool not in ("process", "thread"):
+            raise ValueError(f"Unknown post-processing pool: {pool}")
+        self.pool = pool
+        self.max_workers = max_workers
+        self.processors = processors if processors is not None else POST_PROCESSORS
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.pool == "process":
+                # Workers must not be forked from the threaded server process
+                methods = multiprocessing.get_all_start_methods()
+                method = "forkserver" if "forkserver" in methods else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=multiprocessing.get_context(method)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="post-processing"
+                )
+        return self._executor
+
+    async def run(
+        self,
+        topic: str,
+        content: str,
+        exclude: Iterable[str] = (),
+        include: Iterable[str] | None = None,
+    ) -> Dict[str, Any]:
+        """Run the registered steps in include (default all) but not in exclude.
+
+        Returns the results by step name.
+        """
+        loop = asyncio.get_running_loop()
+        names = [
+            name
+            for name in self.processors
+            if name not in exclude and (include is None or name in include)
+        ]
+        started = time.monotonic()
+        outcomes = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor, self.processors[name], topic, content
+                )
+                for name in names
+            ),
+            return_exceptions=True,
+        )
+        metrics.observe("post_processing_seconds", time.monotonic() - started)
+
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Post-processing step {name} failed: {str(outcome)}")
+                metrics.increment("post_processing_errors", step=name)
+            else:
+                results[name] = outcome
+        return results
+
+    async def warm_up(self) -> None:
+        """Start the pool's workers ahead of the first post."""
+        await self.run("", "")
+
+    def shutdown(self) -> None:
+        """Stop the pool's workers, dropping queued steps.
+
+        Waits for the workers to exit; the server process may end without
+        running exit hooks, which would leave them blocked on the call queue.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
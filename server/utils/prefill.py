@@ -0,0 +1,111 @@
+import os
+import asyncio
+import contextlib
+from typing import List
+
+from utils.logger import logger
+from utils.metrics import metrics
+from utils.scheduler import FairShareScheduler
+
+
+def load_topics(path: str) -> List[str]:
+    """Read one topic per line, skipping blank lines and # comments."""
+    if not os.path.exists(path):
+        logger.warning(f"Prefill topics file {path} does not exist")
+        return []
+    with open(path, "r", encoding="utf-8") as file:
+        lines = (line.strip() for line in file)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+class PrefillWorker:
+    """Warms the stage cache for expected topics while the server is idle.
+
+    Before each topic it waits until no request has asked the scheduler for a
+    slot for ``idle_seconds`` and the scheduler has spare capacity, then runs
+    the agent's research and outline stages for it. The work is cancelled as
+    soon as a request arrives and retried at the next idle period; stages that
+    already finished stay cached, so a preempted topic resumes where it left off.
+    """
+
+    def __init__(
+        self,
+        agent,
+        scheduler: FairShareScheduler,
+        topics_file: str,
+        interval: float = 300,
+        idle_seconds: float = 5,
+    ):
+        self.agent = agent
+        self.scheduler = scheduler
+        self.topics_file = topics_file
+        self.interval = interval
+        self.idle_seconds = idle_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Prefill worker started for topics in {self.topics_file}")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        while True:
+            for topic in load_topics(self.topics_file):
+                if self.agent.is_prefilled(topic):
+                    continue
+
+                while True:
+                    await self._wait_until_idle()
+                    completed = await self._prefill(topic)
+                    if completed is not None:
+                        break
+
+                if completed:
+                    metrics.increment("prefill_completed")
+                    logger.info(f"Prefilled stage cache for topic: {topic}")
+                else:
+                    metrics.increment("prefill_failed")
+                    logger.warning(f"Prefill failed for topic: {topic}")
+
+            await asyncio.sleep(self.interval)
+
+    async def _wait_until_idle(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self.scheduler.wait_for_traffic(), timeout=self.idle_seconds
+                )
+            except asyncio.TimeoutError:
+                if self.scheduler.spare_capacity > 0:
+                    return
+
+    async def _prefill(self, topic: str) -> bool | None:
+        """Prefill a topic; None means it was preempted by real traffic."""
+        work = asyncio.create_task(self.agent.prefill(topic))
+        traffic = asyncio.create_task(self.scheduler.wait_for_traffic())
+        try:
+            await asyncio.wait({work, traffic}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            work.cancel()
+            raise
+        finally:
+            traffic.cancel()
+
+        if work.done():
+            try:
+                return work.result()
+            except Exception as e:
+                logger.error(f"Error prefilling topic {topic}: {str(e)}")
+                return False
+
+        work.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await work
+        metrics.increment("prefill_preempted")
+        logger.debug(f"Prefill of topic {topic} preempted by incoming traffic")
+        return None
@@ -0,0 +1,155 @@
+import os
+import time
+import asyncio
+import cProfile
+from contextvars import ContextVar
+from collections.abc import Coroutine
+from typing import Any, Dict
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from utils.logger import logger
+from utils.metrics import metrics
+
+# Profiler of the request the current task works for, inherited by the tasks
+# it creates
+_active_profiler: ContextVar[cProfile.Profile | None] = ContextVar(
+    "active_profiler", default=None
+)
+
+
+class _ProfiledCoroutine(Coroutine):
+    """Drives a coroutine with a profiler enabled only while it runs.
+
+    The profiler is switched off whenever the coroutine suspends, so other
+    requests sharing the event loop do not show up in its profile.
+    """
+
+    def __init__(self, coro, profiler: cProfile.Profile):
+        self._coro = coro
+        self._profiler = profiler
+
+    def _step(self, method, *args):
+        try:
+            self._profiler.enable()
+        except ValueError:
+            # Another profiler is already active on this thread
+            return method(*args)
+        try:
+            return method(*args)
+        finally:
+            self._profiler.disable()
+
+    def send(self, value):
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args):
+        return self._step(self._coro.throw, *args)
+
+    def close(self):
+        self._coro.close()
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+
+class RequestProfiler:
+    """Captures CPU profiles of individual requests and writes them to disk.
+
+    A request is profiled when its metadata sets ``profile`` or when
+    profiling has been armed for the next requests through ``endpoint``.
+    Profiles cover the request's own task and the tasks it creates, but not
+    work handed to thread or process pools, and are written as pstats files
+    to ``directory``, keeping the newest ``max_files``.
+    """
+
+    def __init__(self, directory: str = "profiles", max_files: int = 50):
+        self.directory = directory
+        self.max_files = max_files
+        self.armed = 0
+
+    def install(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Make tasks created by a profiled request part of its profile."""
+        task_factory = loop.get_task_factory()
+
+        def profiled_task_factory(loop, coro, **kwargs):
+            profiler = _active_profiler.get()
+            if profiler is not None:
+                coro = _ProfiledCoroutine(coro, profiler)
+            if task_factory is not None:
+                return task_factory(loop, coro, **kwargs)
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        loop.set_task_factory(profiled_task_factory)
+
+    def should_profile(self, metadata: Dict[str, Any]) -> bool:
+        if metadata.get("profile"):
+            return True
+        if self.armed > 0:
+            self.armed -= 1
+            return True
+        return False
+
+    async def run(self, coro, name: str) -> Any:
+        """Await coro under a new profiler and write its profile as name."""
+        profiler = cProfile.Profile()
+        token = _active_profiler.set(profiler)
+        try:
+            return await _ProfiledCoroutine(coro, profiler)
+        finally:
+            _active_profiler.reset(token)
+            self._write(profiler, name)
+
+    def _write(self, profiler: cProfile.Profile, name: str) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{int(time.time())}-{name}.prof")
+            profiler.dump_stats(path)
+            metrics.increment("profiles_written")
+            logger.info(f"Wrote request profile {path}")
+            self._prune()
+        except OSError as e:
+            logger.error(f"Error writing request profile {name}: {str(e)}")
+
+    def profiles(self) -> list:
+        """Profile file names, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        names = [name for name in os.listdir(self.directory) if name.endswith(".prof")]
+        return sorted(
+            names, key=lambda name: os.path.getmtime(os.path.join(self.directory, name))
+        )
+
+    def _prune(self) -> None:
+        profiles = self.profiles()
+        for name in profiles[: max(0, len(profiles) - self.max_files)]:
+            os.remove(os.path.join(self.directory, name))
+
+    async def endpoint(self, request: Request) -> JSONResponse:
+        """Arm profiling for the next requests on POST, list profiles on GET.
+
+        POST takes an optional JSON body such as ``{"requests": 5}``.
+        """
+        if request.method == "POST":
+            body = await request.body()
+            try:
+                count = int((await request.json()).get("requests", 1)) if body else 1
+            except (ValueError, AttributeError):
+                return JSONResponse({"error": "Invalid request body"}, status_code=400)
+            self.armed = max(0, count)
+            logger.info(f"Profiling armed for the next {self.armed} requests")
+
+        return JSONResponse(
+            {
+                "armed": self.armed,
+                "directory": self.directory,
+                "profiles": self.profiles(),
+            }
+        )
@@ -0,0 +1,171 @@
+import time
+import heapq
+import asyncio
+import itertools
+from typing import Dict, List, Tuple
+from contextlib import asynccontextmanager
+
+from utils.logger import logger
+from utils.metrics import metrics
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PRIORITY_CLASSES = (INTERACTIVE, BATCH)
+
+
+class FairShareScheduler:
+    """Admission scheduler with priority classes and per-client fair queuing.
+
+    Interactive requests are always dispatched before batch requests, and batch
+    requests can never occupy the slots reserved for interactive traffic. Within
+    a class, clients are served by weighted fair queuing so one client with a
+    large backlog cannot starve the others.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        interactive_reserved: int = 0,
+        client_weights: Dict[str, float] | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.interactive_reserved = min(interactive_reserved, max_concurrency - 1)
+        self.client_weights = client_weights or {}
+
+        self._running = {priority: 0 for priority in PRIORITY_CLASSES}
+        self._queues: Dict[str, List[Tuple[float, int, float, asyncio.Future]]] = {
+            priority: [] for priority in PRIORITY_CLASSES
+        }
+        self._virtual_time = {priority: 0.0 for priority in PRIORITY_CLASSES}
+        self._client_finish: Dict[str, Dict[str, float]] = {
+            priority: {} for priority in PRIORITY_CLASSES
+        }
+        self._sequence = itertools.count()
+        self._traffic = asyncio.Event()
+        logger.info(
+            f"FairShareScheduler initialized with {max_concurrency} slots "
+            f"({self.interactive_reserved} reserved for interactive)"
+        )
+
+    @property
+    def running(self) -> int:
+        """Number of requests currently holding a slot."""
+        return sum(self._running.values())
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def spare_capacity(self) -> int:
+        """Free slots beyond those reserved for interactive traffic."""
+        if self.queued:
+            return 0
+        return max(self.max_concurrency - self.interactive_reserved - self.running, 0)
+
+    async def wait_for_traffic(self) -> None:
+        """Wait until the next request asks for a slot."""
+        await self._traffic.wait()
+
+    @asynccontextmanager
+    async def slot(self, client_id: str, priority: str = INTERACTIVE):
+        """Hold an execution slot for the duration of the block."""
+        if priority not in PRIORITY_CLASSES:
+            priority = INTERACTIVE
+
+        self._traffic.set()
+        self._traffic = asyncio.Event()
+
+        started = time.monotonic()
+        await self._acquire(client_id, priority)
+        metrics.observe(
+            "scheduler_wait_seconds", time.monotonic() - started, priority=priority
+        )
+        try:
+            yield
+        finally:
+            self._running[priority] -= 1
+            self._dispatch()
+            self._update_gauges()
+
+    def _can_run(self, priority: str) -> bool:
+        if self.running >= self.max_concurrency:
+            return False
+        if priority == BATCH:
+            return (
+                self._running[BATCH] < self.max_concurrency - self.interactive_reserved
+            )
+        return True
+
+    def _has_precedence(self, priority: str) -> bool:
+        """Whether anything queued should be served before a new request."""
+        if self._queues[priority]:
+            return True
+        return priority == BATCH and bool(self._queues[INTERACTIVE])
+
+    async def _acquire(self, client_id: str, priority: str) -> None:
+        if not self._has_precedence(priority) and self._can_run(priority):
+            self._running[priority] += 1
+            self._update_gauges()
+            return
+
+        weight = self.client_weights.get(client_id, 1.0)
+        start_tag = max(
+            self._virtual_time[priority],
+            self._client_finish[priority].get(client_id, 0.0),
+        )
+        finish_tag = start_tag + 1.0 / weight
+        self._client_finish[priority][client_id] = finish_tag
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queues[priority],
+            (finish_tag, next(self._sequence), start_tag, waiter),
+        )
+        self._update_gauges()
+        logger.debug(f"Queued {priority} request for client {client_id}")
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before cancellation; hand it back
+                self._running[priority] -= 1
+                self._dispatch()
+            else:
+                self._queues[priority] = [
+                    entry for entry in self._queues[priority] if entry[3] is not waiter
+                ]
+                heapq.heapify(self._queues[priority])
+            self._update_gauges()
+            raise
+
+    def _dispatch(self) -> None:
+        for priority in PRIORITY_CLASSES:
+            queue = self._queues[priority]
+            while queue and self._can_run(priority):
+                _, _, start_tag, waiter = heapq.heappop(queue)
+                if waiter.done():
+                    continue
+                self._virtual_time[priority] = start_tag
+                self._running[priority] += 1
+                waiter.set_result(None)
+
+            if not queue:
+                # Forget finish tags once a class drains so idle clients start fresh
+                self._client_finish[priority].clear()
+                self._virtual_time[priority] = 0.0
+
+            if queue:
+                # Lower classes wait while a higher class is still queued
+                break
+
+    def _update_gauges(self) -> None:
+        for priority in PRIORITY_CLASSES:
+            metrics.set_gauge(
+                "scheduler_queue_depth", len(self._queues[priority]), priority=priority
+            )
+            metrics.set_gauge(
+                "scheduler_running", self._running[priority], priority=priority
+            )
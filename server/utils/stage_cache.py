@@ -0,0 +1,57 @@
+import time
+import hashlib
+from collections import OrderedDict
+from typing import Tuple
+
+from utils.metrics import metrics
+
+RESEARCH = "research"
+OUTLINE = "outline"
+
+
+def cache_key(text: str) -> str:
+    """Key stage inputs by content, ignoring case and whitespace differences."""
+    normalized = " ".join(text.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class StageCache:
+    """LRU cache of stage outputs keyed by stage and input, with a TTL.
+
+    Research is keyed by topic and outlines by the research they were
+    generated from, so a cached outline is only reused with its own research.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 86400):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Tuple[str, str], Tuple[float, str]] = OrderedDict()
+
+    def get(self, stage: str, text: str) -> str | None:
+        """Return the cached output of a stage for an input, if still fresh."""
+        output = self.peek(stage, text)
+        if output is None:
+            metrics.increment("stage_cache_misses", stage=stage)
+            return None
+
+        self._entries.move_to_end((stage, cache_key(text)))
+        metrics.increment("stage_cache_hits", stage=stage)
+        return output
+
+    def peek(self, stage: str, text: str) -> str | None:
+        """Like get, without counting a hit or miss or refreshing recency."""
+        key = (stage, cache_key(text))
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            self._entries.pop(key, None)
+            return None
+        return entry[1]
+
+    def put(self, stage: str, text: str, output: str) -> None:
+        """Store a stage output, evicting the least recently used entries."""
+        key = (stage, cache_key(text))
+        self._entries[key] = (time.monotonic(), output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        metrics.set_gauge("stage_cache_entries", len(self._entries))
@@ -0,0 +1,123 @@
+import time
+from typing import Dict, Any, List
+
+from a2a.server.events import Event, EventQueue
+from a2a.types import Message, Part, TextPart
+
+from utils.metrics import metrics
+
+BLOCK = "block"
+MERGE = "merge"
+BACKPRESSURE_POLICIES = (BLOCK, MERGE)
+
+# Metadata keys a text delta may carry and still be merged with its neighbours
+MERGEABLE_METADATA = {"seq", "stage", "headings"}
+
+
+def is_mergeable(event: Event) -> bool:
+    """Whether an event is a plain text delta that can be folded into another."""
+    return (
+        isinstance(event, Message)
+        and not event.final
+        and bool(event.parts)
+        and all(isinstance(part.root, TextPart) for part in event.parts)
+        and set(event.metadata or {}) <= MERGEABLE_METADATA
+    )
+
+
+class BoundedStreamQueue:
+    """Bounded view of one connection's EventQueue.
+
+    At most ``maxsize`` events wait undelivered in the connection's queue. Once
+    it is full the ``block`` policy waits for the client to drain it, while the
+    ``merge`` policy folds further text deltas of the same stage into a single
+    pending message and only waits for events that cannot be merged. Merged
+    messages keep the sequence number of their last delta, so resuming from
+    them stays exact.
+    """
+
+    def __init__(self, event_queue: EventQueue, maxsize: int, policy: str = MERGE):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.event_queue = event_queue
+        self.maxsize = maxsize
+        self.policy = policy
+
+        self._pending: Message | None = None
+        self._pending_texts: List[str] = []
+        self._pending_metadata: Dict[str, Any] = {}
+
+    @property
+    def depth(self) -> int:
+        """Events enqueued for the connection but not yet delivered."""
+        return self.event_queue.queue.qsize()
+
+    async def put(self, event: Event) -> None:
+        """Enqueue an event, applying the backpressure policy when full."""
+        if self.depth >= self.maxsize:
+            if self.policy == MERGE and self._merge(event):
+                return
+            await self._wait_for_room()
+
+        self._flush_pending()
+        self._enqueue(event)
+
+    async def flush(self) -> None:
+        """Enqueue the pending merged message, if any."""
+        if self._pending is None:
+            return
+        if self.depth >= self.maxsize:
+            await self._wait_for_room()
+        self._flush_pending()
+
+    def _enqueue(self, event: Event) -> None:
+        self.event_queue.enqueue_event(event)
+        metrics.observe("stream_queue_depth", self.depth, policy=self.policy)
+
+    async def _wait_for_room(self) -> None:
+        # The SDK's consumer marks every delivered event done, so join() returns
+        # once the client has caught up with everything enqueued so far
+        started = time.monotonic()
+        await self.event_queue.queue.join()
+        metrics.observe(
+            "stream_stall_seconds", time.monotonic() - started, policy=self.policy
+        )
+
+    def _merge(self, event: Event) -> bool:
+        if not is_mergeable(event):
+            return False
+
+        metadata = event.metadata or {}
+        if self._pending is None:
+            self._pending = event
+            self._pending_texts = [part.root.text for part in event.parts]
+            self._pending_metadata = dict(metadata)
+            return True
+
+        if metadata.get("stage") != self._pending_metadata.get("stage"):
+            return False
+
+        self._pending_texts.extend(part.root.text for part in event.parts)
+        if "seq" in metadata:
+            self._pending_metadata["seq"] = metadata["seq"]
+        if "headings" in metadata:
+            self._pending_metadata["headings"] = [
+                *self._pending_metadata.get("headings", []),
+                *metadata["headings"],
+            ]
+        metrics.increment("stream_chunks_merged", policy=self.policy)
+        return True
+
+    def _flush_pending(self) -> None:
+        if self._pending is None:
+            return
+        message = self._pending.model_copy(
+            update={
+                "parts": [Part(TextPart(text="".join(self._pending_texts)))],
+                "metadata": self._pending_metadata,
+            }
+        )
+        self._pending = None
+        self._pending_texts = []
+        self._pending_metadata = {}
+        self._enqueue(message)
@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict
+
+from a2a.server.tasks import TaskStore
+from a2a.types import Artifact, DataPart, Task, TaskState, TaskStatus
+
+from utils.logger import logger
+from utils.metrics import metrics
+
+FINISHED_STATES = (TaskState.completed, TaskState.failed, TaskState.canceled)
+SUMMARY_FIELDS = ("artifactId", "url", "digest", "length")
+
+
+def compact_task(task: Task) -> Task:
+    """Reduce a finished task to its status and a pointer to its post.
+
+    History and status messages are dropped and artifacts keep only their
+    data parts, which hold artifact store references rather than the post.
+    """
+    artifacts = []
+    summary = {}
+    for artifact in task.artifacts or []:
+        parts = [part for part in artifact.parts if isinstance(part.root, DataPart)]
+        if not parts:
+            continue
+        artifacts.append(
+            Artifact(artifactId=artifact.artifactId, name=artifact.name, parts=parts)
+        )
+        if not summary:
+            reference = parts[0].root.data
+            summary = {
+                key: reference[key] for key in SUMMARY_FIELDS if key in reference
+            }
+
+    return Task(
+        id=task.id,
+        contextId=task.contextId,
+        status=TaskStatus(state=task.status.state, timestamp=task.status.timestamp),
+        artifacts=artifacts or None,
+        metadata={**(task.metadata or {}), "summary": summary},
+    )
+
+
+class RetentionTaskStore(TaskStore):
+    """In-memory task store with compaction and bounded retention.
+
+    Finished tasks are compacted with ``compact_task`` as soon as they are
+    saved, expire ``ttl`` seconds after finishing, and are evicted oldest
+    first once more than ``max_tasks`` are held. Running tasks are never
+    evicted. ``on_evict`` is called with the id of every evicted task so the
+    state kept elsewhere for it, such as artifacts, can be released too.
+    """
+
+    def __init__(
+        self,
+        max_tasks: int = 10000,
+        ttl: float = 3600,
+        on_evict: Callable[[str], None] | None = None,
+    ):
+        self.max_tasks = max_tasks
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.tasks: Dict[str, Task] = {}
+        self.size = 0
+        self._sizes: Dict[str, int] = {}
+        self._finished: OrderedDict[str, float] = OrderedDict()
+
+    async def save(self, task: Task) -> None:
+        if task.status.state in FINISHED_STATES:
+            task = compact_task(task)
+            self._finished[task.id] = time.monotonic()
+            self._finished.move_to_end(task.id)
+
+        size = len(task.model_dump_json(exclude_none=True))
+        self.size += size - self._sizes.get(task.id, 0)
+        self.tasks[task.id] = task
+        self._sizes[task.id] = size
+        self._evict()
+
+    async def get(self, task_id: str) -> Task | None:
+        self._evict()
+        return self.tasks.get(task_id)
+
+    async def delete(self, task_id: str) -> None:
+        self._remove(task_id)
+        self._record()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._finished:
+            task_id, finished_at = next(iter(self._finished.items()))
+            if now - finished_at <= self.ttl and len(self.tasks) <= self.max_tasks:
+                break
+            self._remove(task_id)
+            metrics.increment("task_store_evictions")
+            logger.debug(f"Evicted task {task_id} from the task store")
+            if self.on_evict:
+                self.on_evict(task_id)
+        self._record()
+
+    def _remove(self, task_id: str) -> None:
+        self.tasks.pop(task_id, None)
+        self.size -= self._sizes.pop(task_id, 0)
+        self._finished.pop(task_id, None)
+
+    def _record(self) -> None:
+        metrics.set_gauge("task_store_tasks", len(self._finished), state="finished")
+        metrics.set_gauge(
+            "task_store_tasks", len(self.tasks) - len(self._finished), state="running"
+        )
+        metrics.set_gauge("task_store_bytes", self.size)